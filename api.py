@@ -4,21 +4,35 @@ SmartTravel AI - FastAPI Backend
 RESTful API wrapper around the SmartTravel multi-agent system
 """
 
-import sys
+import os
+import json
+import time
+import asyncio
 import logging
-from pathlib import Path
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Set
+from datetime import date, datetime, timezone
 
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field, validator
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from starlette.concurrency import run_in_threadpool
+import orjson
 import uvicorn
 
-# Add smarttravel to path
-sys.path.insert(0, str(Path(__file__).parent / 'smarttravel'))
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
 
-from smarttravel.agents.concierge import TravelConcierge, TravelRequest
+from smarttravel.agents.concierge import (
+    TravelConcierge,
+    TravelItinerary,
+    TravelRequest,
+    shutdown_search_executor,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -33,7 +47,8 @@ app = FastAPI(
     description="Multi-agent AI travel concierge API powered by Google Gemini",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -45,38 +60,204 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global concierge instance
+# Compress larger JSON payloads such as full trip plans
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Micro-batching of /plan_trip requests
+PLAN_BATCH_MAX_SIZE = int(os.getenv("PLAN_BATCH_MAX_SIZE", "8"))
+PLAN_BATCH_MAX_WAIT_MS = float(os.getenv("PLAN_BATCH_MAX_WAIT_MS", "50"))
+
+# Admission control for /plan_trip
+MAX_CONCURRENT_PLANS = int(os.getenv("MAX_CONCURRENT_PLANS", "8"))
+MAX_QUEUED_PLANS = int(os.getenv("MAX_QUEUED_PLANS", "32"))
+
+# Response caching
+PLAN_CACHE_SIZE = int(os.getenv("PLAN_CACHE_SIZE", "1024"))
+PLAN_CACHE_TTL_SECONDS = float(os.getenv("PLAN_CACHE_TTL_SECONDS", "10800"))
+STATUS_CACHE_TTL_SECONDS = 1.0
+
+# Global concierge instance (one per worker process, built on startup)
 concierge = None
+plan_batcher = None
+plan_limiter = None
+
+
+class TTLCache:
+    """Small in-process LRU cache whose entries expire after a fixed TTL"""
+    
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict = OrderedDict()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: str, value: Any):
+        """Store a value, evicting the least recently used entries if full"""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+class PlanLimiter:
+    """Bounds concurrent trip planning and sheds load once the wait queue is full"""
+    
+    def __init__(self, max_concurrent: int, max_queued: int):
+        self.max_queued = max_queued
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._waiting = 0
+    
+    def is_saturated(self) -> bool:
+        """True when every slot is busy and the wait queue is full"""
+        return self._semaphore.locked() and self._waiting >= self.max_queued
+    
+    async def __aenter__(self):
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        self._semaphore.release()
+
+
+class UTCJSONResponse(ORJSONResponse):
+    """ORJSONResponse that renders UTC datetimes with a trailing Z"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+
+
+plan_cache = TTLCache(PLAN_CACHE_SIZE, PLAN_CACHE_TTL_SECONDS)
+status_cache = TTLCache(1, STATUS_CACHE_TTL_SECONDS)
+
+
+class PlanBatcher:
+    """Coalesces concurrent trip requests into concierge batches
+    
+    Requests that are already queued are handed to
+    TravelConcierge.process_batch_async together, so identical plans are only
+    computed once per batch. A request arriving to an empty queue is
+    dispatched straight away; max_wait_ms only caps how long a batch keeps
+    collecting while more requests keep arriving.
+    """
+    
+    def __init__(self, travel_concierge: TravelConcierge, max_batch_size: int, max_wait_ms: float):
+        self.concierge = travel_concierge
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._dispatches: Set[asyncio.Task] = set()
+    
+    def start(self):
+        """Start draining the request queue"""
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Stop taking batches, let in-flight batches finish and cancel queued requests"""
+        if self._worker:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        
+        if self._dispatches:
+            await asyncio.gather(*self._dispatches, return_exceptions=True)
+        
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+    
+    async def submit(self, travel_request: TravelRequest) -> TravelItinerary:
+        """Queue a request and wait for its itinerary"""
+        if self._queue is None or self._worker is None:
+            raise RuntimeError("PlanBatcher is not running")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((travel_request, future))
+        return await future
+    
+    async def _run(self):
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                await self._collect(batch, loop.time() + self.max_wait)
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    future.cancel()
+                raise
+            
+            # Dispatch in the background so the next batch can start filling
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+    
+    async def _collect(self, batch: List[Any], deadline: float):
+        """Add waiting requests to a batch until the queue drains, it is full or the deadline passes"""
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        while len(batch) < self.max_batch_size and loop.time() < deadline:
+            if self._queue.empty():
+                # Give requests submitted in the same tick a chance to join
+                await asyncio.sleep(0)
+                if self._queue.empty():
+                    return
+            batch.append(self._queue.get_nowait())
+    
+    async def _dispatch(self, batch):
+        requests = [travel_request for travel_request, _ in batch]
+        try:
+            results = await self.concierge.process_batch_async(requests, return_exceptions=True)
+        except Exception as e:
+            results = [e] * len(batch)
+        
+        # Each request gets its own result or error, so one bad request
+        # cannot fail or delay its neighbours
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
 
 
 class TripRequest(BaseModel):
     """Request model for trip planning"""
+    model_config = ConfigDict(extra='forbid', frozen=True)
+    
     destination: str = Field(..., description="Travel destination", min_length=1)
-    start_date: str = Field(..., description="Start date (YYYY-MM-DD)")
-    end_date: str = Field(..., description="End date (YYYY-MM-DD)")
+    start_date: date = Field(..., description="Start date (YYYY-MM-DD)")
+    end_date: date = Field(..., description="End date (YYYY-MM-DD)")
     origin: Optional[str] = Field(None, description="Origin city/airport")
     budget: Optional[float] = Field(None, description="Budget in INR", gt=0)
     travelers: int = Field(1, description="Number of travelers", gt=0, le=20)
     preferences: Dict[str, Any] = Field(default_factory=dict, description="Travel preferences")
 
-    @validator('start_date', 'end_date')
-    def validate_date_format(cls, v):
-        """Validate date format"""
-        try:
-            datetime.strptime(v, '%Y-%m-%d')
-            return v
-        except ValueError:
-            raise ValueError('Date must be in YYYY-MM-DD format')
-
-    @validator('end_date')
-    def validate_end_after_start(cls, v, values):
+    @model_validator(mode='after')
+    def validate_end_after_start(self) -> 'TripRequest':
         """Validate end date is after start date"""
-        if 'start_date' in values:
-            start = datetime.strptime(values['start_date'], '%Y-%m-%d')
-            end = datetime.strptime(v, '%Y-%m-%d')
-            if end <= start:
-                raise ValueError('end_date must be after start_date')
-        return v
+        if self.end_date <= self.start_date:
+            raise ValueError('end_date must be after start_date')
+        return self
 
 
 class TripResponse(BaseModel):
@@ -107,16 +288,27 @@ class ErrorResponse(BaseModel):
 @app.on_event("startup")
 async def startup_event():
     """Initialize the concierge on startup"""
-    global concierge
+    global concierge, plan_batcher, plan_limiter
     try:
         logger.info("Initializing SmartTravel AI Concierge...")
         concierge = TravelConcierge()
+        plan_limiter = PlanLimiter(MAX_CONCURRENT_PLANS, MAX_QUEUED_PLANS)
+        plan_batcher = PlanBatcher(concierge, PLAN_BATCH_MAX_SIZE, PLAN_BATCH_MAX_WAIT_MS)
+        plan_batcher.start()
         logger.info("SmartTravel AI API is ready!")
     except Exception as e:
         logger.error(f"Failed to initialize concierge: {e}")
         raise
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the request batcher and the concierge search pool on shutdown"""
+    if plan_batcher:
+        await plan_batcher.stop()
+    await run_in_threadpool(shutdown_search_executor)
+
+
 @app.get("/", response_model=Dict[str, str])
 async def root():
     """Root endpoint with API information"""
@@ -131,11 +323,12 @@ async def root():
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint"""
-    return HealthResponse(
-        status="healthy" if concierge else "unhealthy",
-        timestamp=datetime.now().isoformat(),
-        version="1.0.0"
-    )
+    # Returned as a prebuilt response so frequent liveness probes skip model validation
+    return UTCJSONResponse({
+        "status": "healthy" if concierge else "unhealthy",
+        "timestamp": datetime.now(timezone.utc),
+        "version": "1.0.0"
+    })
 
 
 @app.post(
@@ -144,6 +337,7 @@ async def health_check():
     status_code=status.HTTP_200_OK,
     responses={
         400: {"model": ErrorResponse, "description": "Invalid request"},
+        429: {"model": ErrorResponse, "description": "Server busy"},
         500: {"model": ErrorResponse, "description": "Internal server error"}
     }
 )
@@ -168,49 +362,68 @@ async def plan_trip(request: TripRequest) -> TripResponse:
             detail="Travel concierge service unavailable"
         )
     
-    try:
-        logger.info(f"Processing trip request for {request.destination}")
-        
-        # Convert API request to internal TravelRequest
-        travel_request = TravelRequest(
-            destination=request.destination,
-            start_date=request.start_date,
-            end_date=request.end_date,
-            origin=request.origin or "",
-            budget=request.budget,
-            preferences=request.preferences,
-            travelers=request.travelers
-        )
-        
-        # Process the request through the concierge
-        itinerary = concierge.process_request(travel_request)
-        
-        # Convert internal itinerary to API response
-        response = TripResponse(
-            destination=itinerary.destination,
-            duration_days=itinerary.duration_days,
-            flights=itinerary.flights,
-            accommodations=itinerary.accommodations,
-            attractions=itinerary.attractions,
-            daily_schedule=itinerary.daily_schedule,
-            total_estimated_cost=itinerary.total_estimated_cost
-        )
-        
-        logger.info(f"Successfully generated trip plan for {request.destination}")
-        return response
-        
-    except ValueError as e:
-        logger.error(f"Validation error: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        logger.error(f"Error processing trip request: {e}", exc_info=True)
+    # Identical requests are answered from the cache without replanning
+    cache_key = json.dumps(request.model_dump(), sort_keys=True, default=str)
+    cached_response = plan_cache.get(cache_key)
+    if cached_response is not None:
+        logger.info(f"Serving cached trip plan for {request.destination}")
+        return cached_response.model_copy(deep=True)
+    
+    if plan_limiter.is_saturated():
+        logger.warning(f"Rejecting trip request for {request.destination}: server busy")
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to generate trip plan: {str(e)}"
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Server busy, please retry shortly"
         )
+    
+    async with plan_limiter:
+        try:
+            logger.info(f"Processing trip request for {request.destination}")
+            
+            # Convert API request to internal TravelRequest
+            travel_request = TravelRequest(
+                destination=request.destination,
+                start_date=request.start_date.isoformat(),
+                end_date=request.end_date.isoformat(),
+                origin=request.origin or "",
+                budget=request.budget,
+                # frozen only blocks reassigning fields; the dict itself is
+                # still mutable, so the concierge gets its own copy
+                preferences=dict(request.preferences),
+                travelers=request.travelers
+            )
+            
+            # Process the request through the concierge, batched with concurrent requests
+            itinerary = await plan_batcher.submit(travel_request)
+            
+            # Convert internal itinerary to API response
+            response = TripResponse(
+                destination=itinerary.destination,
+                duration_days=itinerary.duration_days,
+                flights=itinerary.flights,
+                accommodations=itinerary.accommodations,
+                attractions=itinerary.attractions,
+                daily_schedule=itinerary.daily_schedule,
+                total_estimated_cost=itinerary.total_estimated_cost
+            )
+            
+            plan_cache.set(cache_key, response)
+            
+            logger.info(f"Successfully generated trip plan for {request.destination}")
+            return response
+            
+        except ValueError as e:
+            logger.error(f"Validation error: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        except Exception as e:
+            logger.error(f"Error processing trip request: {e}", exc_info=True)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to generate trip plan: {str(e)}"
+            )
 
 
 @app.get("/status")
@@ -223,7 +436,11 @@ async def get_status():
         )
     
     try:
-        return concierge.get_status()
+        concierge_status = status_cache.get("status")
+        if concierge_status is None:
+            concierge_status = await run_in_threadpool(concierge.get_status)
+            status_cache.set("status", concierge_status)
+        return concierge_status
     except Exception as e:
         logger.error(f"Error getting status: {e}")
         raise HTTPException(
@@ -233,11 +450,26 @@ async def get_status():
 
 
 if __name__ == "__main__":
-    # Run the API server
-    uvicorn.run(
-        "api:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info"
-    )
+    loop = "uvloop" if uvloop else "asyncio"
+    if os.getenv("SMARTTRAVEL_ENV", "dev") == "prod":
+        # Production: one worker per core, no reloader and no per-request access log
+        uvicorn.run(
+            "api:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1))),
+            loop=loop,
+            http="httptools",
+            access_log=False,
+            log_level="warning"
+        )
+    else:
+        # Development: single worker with auto-reload
+        uvicorn.run(
+            "api:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True,
+            log_level="info",
+            loop=loop
+        )
@@ -6,12 +6,25 @@ User-friendly web interface for SmartTravel AI travel planning
 
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
-import json
+import orjson
 
 # API Configuration
 API_BASE_URL = "http://localhost:8000"
 
+
+@st.cache_resource
+def get_api_session() -> requests.Session:
+    """Shared HTTP session so API calls reuse pooled keep-alive connections"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Accept-Encoding": "gzip"})
+    return session
+
+
 # Page config
 st.set_page_config(
     page_title="SmartTravel AI",
@@ -117,7 +130,7 @@ if plan_button:
                 }
                 
                 # Call API
-                response = requests.post(
+                response = get_api_session().post(
                     f"{API_BASE_URL}/plan_trip",
                     json=payload,
                     timeout=60
@@ -195,7 +208,7 @@ if plan_button:
                     # Download button for the itinerary
                     st.download_button(
                         label="📥 Download Itinerary (JSON)",
-                        data=json.dumps(result, indent=2),
+                        data=orjson.dumps(result, option=orjson.OPT_INDENT_2),
                         file_name=f"smarttravel_{destination}_{start_date}.json",
                         mime="application/json"
                     )
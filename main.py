@@ -7,10 +7,6 @@ Multi-agent travel concierge CLI application
 import sys
 import argparse
 import logging
-from pathlib import Path
-
-# Add smarttravel to path
-sys.path.insert(0, str(Path(__file__).parent / 'smarttravel'))
 
 from smarttravel.agents.concierge import TravelConcierge
 
@@ -7,6 +7,6 @@ __version__ = "1.0.0"
 __author__ = "SmartTravel AI Team"
 
 from .agents import TravelConcierge
-from .config import Config
+from .config import Config, get_config
 
-__all__ = ["TravelConcierge", "Config"]
+__all__ = ["TravelConcierge", "Config", "get_config"]
@@ -13,26 +13,34 @@ This package contains various specialized agents for travel planning:
 - CurrencyConverterAgent: Multi-currency conversion and budgeting
 """
 
-from .concierge import TravelConcierge
-from .flight_agent import FlightAgent
-from .hotel_agent import HotelAgent
-from .attraction_agent import AttractionAgent
-from .itinerary_agent import ItineraryAgent
-from .restaurant_agent import RestaurantAgent
-from .weather_agent import WeatherAgent
-from .disruption_agent import DisruptionAgent
-from .budget_optimizer_agent import BudgetOptimizerAgent
-from .currency_converter_agent import CurrencyConverterAgent
-
-__all__ = [
-    "TravelConcierge",
-    "FlightAgent",
-    "HotelAgent",
-    "AttractionAgent",
-    "ItineraryAgent",
-        "RestaurantAgent",
-        "WeatherAgent",
-        "DisruptionAgent",
-        "BudgetOptimizerAgent",
-        "CurrencyConverterAgent",
-]
+import importlib
+
+# Agents are imported on first access (PEP 562) so that importing the package
+# only loads the agent modules a caller actually uses.
+_AGENT_MODULES = {
+    "TravelConcierge": ".concierge",
+    "FlightAgent": ".flight_agent",
+    "HotelAgent": ".hotel_agent",
+    "AttractionAgent": ".attraction_agent",
+    "ItineraryAgent": ".itinerary_agent",
+    "RestaurantAgent": ".restaurant_agent",
+    "WeatherAgent": ".weather_agent",
+    "DisruptionAgent": ".disruption_agent",
+    "BudgetOptimizerAgent": ".budget_optimizer_agent",
+    "CurrencyConverterAgent": ".currency_converter_agent",
+}
+
+__all__ = list(_AGENT_MODULES)
+
+
+def __getattr__(name):
+    module_name = _AGENT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,15 +3,19 @@
 Specialized agent for discovering and recommending local attractions.
 """
 
+import heapq
 import logging
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+import math
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, replace
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Attraction:
     """Data class for attractions"""
     name: str
@@ -24,6 +28,81 @@ class Attraction:
     open_hours: str = "09:00-18:00"
 
 
+# Mock attraction catalog as Attraction prototypes; "{destination}" in the
+# name and location is filled in per search
+_ATTRACTION_TEMPLATES = (
+    Attraction(
+        name="{destination} Museum of Art",
+        category="museum",
+        location="Cultural District, {destination}",
+        description="World-renowned art museum with extensive collections",
+        rating=4.7,
+        price=25.0,
+        duration_hours=3.0
+    ),
+    Attraction(
+        name="{destination} Central Park",
+        category="park",
+        location="City Center, {destination}",
+        description="Beautiful urban park perfect for relaxation",
+        rating=4.5,
+        price=0.0,
+        duration_hours=2.0
+    ),
+    Attraction(
+        name="Historic {destination} Tower",
+        category="landmark",
+        location="Old Town, {destination}",
+        description="Iconic landmark with panoramic city views",
+        rating=4.8,
+        price=15.0,
+        duration_hours=1.5
+    ),
+    Attraction(
+        name="{destination} Food Market",
+        category="food",
+        location="Market District, {destination}",
+        description="Vibrant food market with local specialties",
+        rating=4.6,
+        price=0.0,
+        duration_hours=2.0
+    ),
+    Attraction(
+        name="{destination} Walking Tour",
+        category="tour",
+        location="Various locations, {destination}",
+        description="Guided walking tour through historic neighborhoods",
+        rating=4.4,
+        price=35.0,
+        duration_hours=3.0
+    ),
+)
+
+
+@lru_cache(maxsize=4096)
+def _find_attractions(
+    destination: str,
+    categories: Tuple[str, ...],
+    max_results: int
+) -> Tuple[Attraction, ...]:
+    """Look up attractions for a destination, memoized per search"""
+    # Mock implementation - in production, this would call travel APIs
+    category_filter = frozenset(categories) if categories else None
+    templates = [
+        t for t in _ATTRACTION_TEMPLATES
+        if category_filter is None or t.category in category_filter
+    ]
+    
+    return tuple(
+        replace(
+            t,
+            name=t.name.format(destination=destination),
+            location=t.location.format(destination=destination)
+        )
+        for t in templates[:max_results]
+    )
+
+
 class AttractionAgent:
     """Agent specialized in attraction discovery and recommendations
     
@@ -39,6 +118,7 @@ class AttractionAgent:
         """
         self.config = config
         self.initialized_at = datetime.now()
+        self._init_iso = self.initialized_at.isoformat()
         logger.info("AttractionAgent initialized")
     
     def discover_attractions(
@@ -59,63 +139,9 @@ class AttractionAgent:
         """
         logger.info(f"Discovering attractions in {destination}")
         
-        # Mock implementation - in production, this would call travel APIs
-        all_attractions = [
-            Attraction(
-                name=f"{destination} Museum of Art",
-                category="museum",
-                location=f"Cultural District, {destination}",
-                description="World-renowned art museum with extensive collections",
-                rating=4.7,
-                price=25.0,
-                duration_hours=3.0
-            ),
-            Attraction(
-                name=f"{destination} Central Park",
-                category="park",
-                location=f"City Center, {destination}",
-                description="Beautiful urban park perfect for relaxation",
-                rating=4.5,
-                price=0.0,
-                duration_hours=2.0
-            ),
-            Attraction(
-                name=f"Historic {destination} Tower",
-                category="landmark",
-                location=f"Old Town, {destination}",
-                description="Iconic landmark with panoramic city views",
-                rating=4.8,
-                price=15.0,
-                duration_hours=1.5
-            ),
-            Attraction(
-                name=f"{destination} Food Market",
-                category="food",
-                location=f"Market District, {destination}",
-                description="Vibrant food market with local specialties",
-                rating=4.6,
-                price=0.0,
-                duration_hours=2.0
-            ),
-            Attraction(
-                name=f"{destination} Walking Tour",
-                category="tour",
-                location=f"Various locations, {destination}",
-                description="Guided walking tour through historic neighborhoods",
-                rating=4.4,
-                price=35.0,
-                duration_hours=3.0
-            )
-        ]
-        
-        # Filter by categories if specified
-        if categories:
-            all_attractions = [
-                a for a in all_attractions 
-                if a.category in categories
-            ]
-        
-        return all_attractions[:max_results]
+        # Categories are normalised so equivalent filters share a cache entry
+        category_key = tuple(sorted(set(categories))) if categories else ()
+        return list(_find_attractions(destination, category_key, max_results))
     
     def get_top_attractions(
         self,
@@ -131,12 +157,7 @@ class AttractionAgent:
         Returns:
             List of top-rated Attraction objects
         """
-        sorted_attractions = sorted(
-            attractions, 
-            key=lambda a: a.rating, 
-            reverse=True
-        )
-        return sorted_attractions[:count]
+        return heapq.nlargest(count, attractions, key=attrgetter("rating"))
     
     def calculate_activities_cost(
         self,
@@ -150,7 +171,7 @@ class AttractionAgent:
         Returns:
             Total cost for all attractions
         """
-        return sum(a.price for a in attractions)
+        return math.fsum(map(attrgetter("price"), attractions))
     
     def estimate_time_needed(
         self,
@@ -164,12 +185,12 @@ class AttractionAgent:
         Returns:
             Total hours needed
         """
-        return sum(a.duration_hours for a in attractions)
+        return math.fsum(map(attrgetter("duration_hours"), attractions))
     
     def get_status(self) -> Dict[str, Any]:
         """Get current agent status"""
         return {
             "agent": "AttractionAgent",
             "status": "active",
-            "initialized_at": self.initialized_at.isoformat()
+            "initialized_at": self._init_iso
         }
@@ -5,16 +5,19 @@ options for flights, accommodations, and activities within user's budget.
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from operator import attrgetter
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
 class PriorityCategory(Enum):
-    """Budget allocation priorities"""
+    """Budget allocation priorities, in BudgetBreakdown field order"""
     ACCOMMODATION = "accommodation"
     TRANSPORTATION = "transportation"
     FOOD = "food"
@@ -29,7 +32,106 @@ class BudgetTier(Enum):
     LUXURY = "luxury"  # Premium options
 
 
-@dataclass
+# Budget tiers in the order used by vectorized tier indices
+_TIERS = (BudgetTier.BUDGET, BudgetTier.MID_RANGE, BudgetTier.LUXURY)
+
+
+@dataclass(slots=True)
+class _Option:
+    """Option fields read once from a raw option dict"""
+    name: str
+    price: float
+    rating: float
+    features: List[str]
+
+
+def _coerce_option(option: Dict[str, Any]) -> _Option:
+    """Read the fields used for scoring from an option dict"""
+    return _Option(
+        name=option.get("name", "Unknown"),
+        price=option.get("price", 0),
+        rating=option.get("rating", 3.0),
+        features=option.get("features", [])
+    )
+
+
+def _options_to_arrays(
+    options: List[_Option]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split options into price, rating and feature-count arrays"""
+    count = len(options)
+    prices = np.fromiter(
+        map(attrgetter("price"), options), dtype=np.float64, count=count
+    )
+    ratings = np.fromiter(
+        map(attrgetter("rating"), options), dtype=np.float64, count=count
+    )
+    feature_counts = np.fromiter(
+        (len(opt.features) for opt in options), dtype=np.int32, count=count
+    )
+    return prices, ratings, feature_counts
+
+
+def _score_options(
+    prices: np.ndarray,
+    ratings: np.ndarray,
+    feature_counts: np.ndarray,
+    avg_price: Union[float, np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Score options column-wise
+    
+    Args:
+        prices: Option prices
+        ratings: Option ratings
+        feature_counts: Number of features per option
+        avg_price: Average price used for savings and tiers (scalar or per option)
+    
+    Returns:
+        Tuple of (value scores, savings, tier indices into _TIERS)
+    """
+    # Simple value formula: (rating * features) / price (higher is better)
+    value_scores = ratings * (feature_counts + 1) / np.where(prices > 0, prices, 1.0)
+    
+    # Savings vs average, never negative
+    savings = np.maximum(avg_price - prices, 0.0)
+    
+    # Tier index: budget (0) / mid-range (1) / luxury (2), as a sum of two comparisons
+    tiers = (prices >= avg_price * 0.7).astype(np.intp) + (prices > avg_price * 1.3)
+    
+    return value_scores, savings, tiers
+
+
+# General money-saving tips
+_BASE_TIPS: Tuple[str, ...] = (
+    "Book flights and accommodation in advance for better rates",
+    "Travel during off-peak season for significant savings",
+    "Use public transportation instead of taxis or rideshares",
+)
+
+# Tier-specific money-saving tips
+_TIER_TIPS: Dict[BudgetTier, Tuple[str, ...]] = {
+    BudgetTier.BUDGET: (
+        "Consider hostels or budget hotels for accommodation",
+        "Cook some meals instead of dining out for every meal",
+        "Look for free walking tours and attractions",
+        "Buy groceries from local markets instead of tourist areas",
+    ),
+    BudgetTier.MID_RANGE: (
+        "Mix budget and mid-range accommodation for balance",
+        "Have lunch at restaurants instead of dinner for lower prices",
+        "Book combination tickets for multiple attractions",
+        "Use hotel loyalty programs for perks and discounts",
+    ),
+}
+
+# Tips for trips of a week or longer
+_WEEK_PLUS_TIPS: Tuple[str, ...] = (
+    "Consider weekly rental rates for accommodation",
+    "Buy a multi-day transit pass for unlimited travel",
+)
+
+
+@dataclass(slots=True)
 class BudgetBreakdown:
     """Recommended budget allocation"""
     total_budget: float
@@ -52,7 +154,7 @@ class BudgetBreakdown:
         self.remaining = self.total_budget - allocated
 
 
-@dataclass
+@dataclass(slots=True)
 class OptimizedOption:
     """A budget-optimized travel option"""
     category: str
@@ -64,7 +166,7 @@ class OptimizedOption:
     tier: BudgetTier = BudgetTier.MID_RANGE
 
 
-@dataclass  
+@dataclass(slots=True)
 class BudgetOptimizationResult:
     """Complete budget optimization results"""
     breakdown: BudgetBreakdown
@@ -82,14 +184,8 @@ class BudgetOptimizerAgent:
     provides money-saving recommendations, and optimizes spending allocation.
     """
     
-    # Default budget allocation percentages
-    DEFAULT_ALLOCATION = {
-        PriorityCategory.ACCOMMODATION: 0.35,
-        PriorityCategory.TRANSPORTATION: 0.25,
-        PriorityCategory.FOOD: 0.20,
-        PriorityCategory.ACTIVITIES: 0.15,
-        PriorityCategory.EMERGENCY: 0.05,
-    }
+    # Default budget allocation percentages, in PriorityCategory order
+    DEFAULT_ALLOCATION: Tuple[float, ...] = (0.35, 0.25, 0.20, 0.15, 0.05)
     
     def __init__(self, config=None):
         """Initialize the Budget Optimizer Agent
@@ -99,6 +195,7 @@ class BudgetOptimizerAgent:
         """
         self.config = config
         self.initialized_at = datetime.now()
+        self._init_iso = self.initialized_at.isoformat()
         logger.info("BudgetOptimizerAgent initialized")
     
     def optimize_budget(
@@ -120,23 +217,17 @@ class BudgetOptimizerAgent:
         logger.info(f"Optimizing budget: ${total_budget} for {duration_days} days")
         
         # Use custom priorities or defaults
-        allocation_weights = priorities if priorities else self.DEFAULT_ALLOCATION
+        if priorities:
+            weights = tuple(
+                priorities.get(category, default)
+                for category, default in zip(PriorityCategory, self.DEFAULT_ALLOCATION)
+            )
+        else:
+            weights = self.DEFAULT_ALLOCATION
         
         # Calculate per-category budgets
-        accommodation = total_budget * allocation_weights.get(
-            PriorityCategory.ACCOMMODATION, 0.35
-        )
-        transportation = total_budget * allocation_weights.get(
-            PriorityCategory.TRANSPORTATION, 0.25
-        )
-        food = total_budget * allocation_weights.get(
-            PriorityCategory.FOOD, 0.20
-        )
-        activities = total_budget * allocation_weights.get(
-            PriorityCategory.ACTIVITIES, 0.15
-        )
-        emergency = total_budget * allocation_weights.get(
-            PriorityCategory.EMERGENCY, 0.05
+        accommodation, transportation, food, activities, emergency = (
+            total_budget * weight for weight in weights
         )
         
         return BudgetBreakdown(
@@ -152,7 +243,8 @@ class BudgetOptimizerAgent:
         self,
         options: List[Dict[str, Any]],
         budget: float,
-        category: str
+        category: str,
+        top_k: Optional[int] = None
     ) -> List[OptimizedOption]:
         """Find best value options within budget
         
@@ -160,53 +252,103 @@ class BudgetOptimizerAgent:
             options: List of available options with price and features
             budget: Maximum budget for this category
             category: Category name (flights, hotels, etc.)
+            top_k: Only return the top_k best value options (optional)
         
         Returns:
             List of OptimizedOption sorted by value score
         """
-        optimized = []
+        if not options:
+            return []
+        
+        opts = [_coerce_option(option) for option in options]
+        prices, ratings, feature_counts = _options_to_arrays(opts)
         
         # Calculate average price for comparison
-        if options:
-            avg_price = sum(opt.get("price", 0) for opt in options) / len(options)
-        else:
-            avg_price = budget
-        
-        for option in options:
-            price = option.get("price", 0)
-            
-            # Skip if over budget
-            if price > budget:
-                continue
-            
-            # Calculate value score (higher is better)
-            # Based on price vs features
-            features = option.get("features", [])
-            rating = option.get("rating", 3.0)
-            
-            # Simple value formula: (rating * features) / price
-            value_score = (rating * (len(features) + 1)) / (price if price > 0 else 1)
-            
-            # Calculate savings
-            savings = avg_price - price
-            
-            # Determine tier
-            tier = self._determine_tier(price, avg_price)
-            
-            optimized.append(OptimizedOption(
+        avg_price = prices.mean()
+        
+        value_scores, savings, tiers = _score_options(
+            prices, ratings, feature_counts, avg_price
+        )
+        
+        # Drop options over budget, then sort by value score (best value first)
+        within_budget = np.flatnonzero(prices <= budget)
+        if top_k is not None and 0 < top_k < within_budget.size:
+            # Partition to find the k-th best score so only candidates at or above it get sorted
+            neg_scores = -value_scores[within_budget]
+            cutoff = np.partition(neg_scores, top_k - 1)[top_k - 1]
+            within_budget = within_budget[neg_scores <= cutoff]
+        order = within_budget[np.argsort(-value_scores[within_budget], kind="stable")][:top_k]
+        
+        return [
+            OptimizedOption(
                 category=category,
-                name=option.get("name", "Unknown"),
-                price=price,
-                value_score=value_score,
-                savings=max(0, savings),
-                features=features,
-                tier=tier
-            ))
-        
-        # Sort by value score (best value first)
-        optimized.sort(key=lambda x: x.value_score, reverse=True)
-        
-        return optimized
+                name=opts[i].name,
+                price=float(prices[i]),
+                value_score=float(value_scores[i]),
+                savings=float(savings[i]),
+                features=opts[i].features,
+                tier=_TIERS[tiers[i]]
+            )
+            for i in order
+        ]
+    
+    def _best_value_options_by_category(
+        self,
+        groups: List[Tuple[str, List[Dict[str, Any]], float]],
+        top_k: int
+    ) -> Tuple[List[OptimizedOption], float]:
+        """Find the top_k best value options of several categories at once
+        
+        Equivalent to calling find_best_value_options per category, but all
+        options are scored in a single vectorized pass.
+        
+        Args:
+            groups: (category, options, budget) tuples
+            top_k: Number of options to keep per category
+        
+        Returns:
+            Tuple of (OptimizedOption list grouped by category in input order,
+            total price of the selected options)
+        """
+        groups = [group for group in groups if group[1]]
+        if not groups:
+            return [], 0.0
+        
+        opts = [_coerce_option(option) for _, options, _ in groups for option in options]
+        prices, ratings, feature_counts = _options_to_arrays(opts)
+        
+        # Category index of every option, with per-category average and budget
+        cat_idx = np.repeat(np.arange(len(groups)), [len(options) for _, options, _ in groups])
+        avg_prices = np.bincount(cat_idx, weights=prices) / np.bincount(cat_idx)
+        budgets = np.array([budget for _, _, budget in groups], dtype=np.float64)
+        
+        value_scores, savings, tiers = _score_options(
+            prices, ratings, feature_counts, avg_prices[cat_idx]
+        )
+        
+        # Order by category, then by value score (best value first), dropping over-budget options
+        order = np.lexsort((-value_scores, cat_idx))
+        order = order[prices[order] <= budgets[cat_idx[order]]]
+        
+        # Keep the first top_k entries of each category run
+        sorted_cats = cat_idx[order]
+        starts = np.searchsorted(sorted_cats, np.arange(len(groups)))
+        ends = np.minimum(np.append(starts[1:], len(order)), starts + top_k)
+        selected = np.concatenate([order[start:end] for start, end in zip(starts, ends)])
+        
+        optimized = [
+            OptimizedOption(
+                category=groups[cat_idx[i]][0],
+                name=opts[i].name,
+                price=float(prices[i]),
+                value_score=float(value_scores[i]),
+                savings=float(savings[i]),
+                features=opts[i].features,
+                tier=_TIERS[tiers[i]]
+            )
+            for i in selected
+        ]
+        return optimized, float(prices[selected].sum())
     
     def generate_money_saving_tips(
         self,
@@ -224,34 +366,13 @@ class BudgetOptimizerAgent:
         Returns:
             List of money-saving tips
         """
-        tips = []
-        
-        # General tips
-        tips.append("Book flights and accommodation in advance for better rates")
-        tips.append("Travel during off-peak season for significant savings")
-        tips.append("Use public transportation instead of taxis or rideshares")
-        
-        if budget_tier == BudgetTier.BUDGET:
-            tips.extend([
-                "Consider hostels or budget hotels for accommodation",
-                "Cook some meals instead of dining out for every meal",
-                "Look for free walking tours and attractions",
-                "Buy groceries from local markets instead of tourist areas"
-            ])
-        elif budget_tier == BudgetTier.MID_RANGE:
-            tips.extend([
-                "Mix budget and mid-range accommodation for balance",
-                "Have lunch at restaurants instead of dinner for lower prices",
-                "Book combination tickets for multiple attractions",
-                "Use hotel loyalty programs for perks and discounts"
-            ])
+        tips = _BASE_TIPS + _TIER_TIPS.get(budget_tier, ())
         
         # Duration-based tips
         if duration_days >= 7:
-            tips.append("Consider weekly rental rates for accommodation")
-            tips.append("Buy a multi-day transit pass for unlimited travel")
+            tips += _WEEK_PLUS_TIPS
         
-        return tips
+        return list(tips)
     
     def calculate_trip_cost(
         self,
@@ -297,28 +418,25 @@ class BudgetOptimizerAgent:
         # Create budget breakdown
         breakdown = self.optimize_budget(total_budget, duration_days)
         
-        # Find best value options for each category
-        optimized_options = []
-        
-        for category, budget_amount in [
-            ("accommodation", breakdown.accommodation),
-            ("transportation", breakdown.transportation),
-            ("activities", breakdown.activities)
-        ]:
-            if category in available_options:
-                best_options = self.find_best_value_options(
-                    available_options[category],
-                    budget_amount,
-                    category
-                )
-                optimized_options.extend(best_options[:3])  # Top 3 per category
+        # Find best value options for each category in one scoring pass
+        optimized_options, estimated_total = self._best_value_options_by_category(
+            [
+                (category, available_options[category], budget_amount)
+                for category, budget_amount in [
+                    ("accommodation", breakdown.accommodation),
+                    ("transportation", breakdown.transportation),
+                    ("activities", breakdown.activities)
+                ]
+                if category in available_options
+            ],
+            top_k=3  # Top 3 per category
+        )
         
         # Generate money-saving tips
         tier = self._estimate_budget_tier(total_budget, duration_days)
         tips = self.generate_money_saving_tips(destination, duration_days, tier)
         
         # Calculate estimates
-        estimated_total = sum(opt.price for opt in optimized_options)
         potential_savings = total_budget - estimated_total
         
         return BudgetOptimizationResult(
@@ -329,15 +447,6 @@ class BudgetOptimizerAgent:
             potential_savings=potential_savings
         )
     
-    def _determine_tier(self, price: float, avg_price: float) -> BudgetTier:
-        """Determine budget tier based on price comparison"""
-        if price < avg_price * 0.7:
-            return BudgetTier.BUDGET
-        elif price > avg_price * 1.3:
-            return BudgetTier.LUXURY
-        else:
-            return BudgetTier.MID_RANGE
-    
     def _estimate_budget_tier(
         self, 
         total_budget: float, 
@@ -358,11 +467,11 @@ class BudgetOptimizerAgent:
         return {
             "agent": "BudgetOptimizerAgent",
             "status": "active",
-            "initialized_at": self.initialized_at.isoformat(),
+            "initialized_at": self._init_iso,
             "features": [
                 "budget_optimization",
                 "value_analysis",
                 "savings_tips",
                 "cost_estimation"
             ]
-        
+        }
@@ -3,23 +3,111 @@
 Coordinates multiple specialized agents to provide comprehensive travel planning.
 """
 
+import asyncio
+import copy
+import json
 import logging
-from typing import Dict, List, Any, Optional
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 
-from .flight_agent import FlightAgent
-from .hotel_agent import HotelAgent
-from .attraction_agent import AttractionAgent
-from .itinerary_agent import ItineraryAgent
-from .weather_agent import WeatherAgent
-from .disruption_agent import DisruptionAgent
+if TYPE_CHECKING:
+    from .flight_agent import FlightAgent, FlightOption
+    from .hotel_agent import HotelAgent, HotelOption
+    from .attraction_agent import AttractionAgent, Attraction
+    from .itinerary_agent import ItineraryAgent
+    from .disruption_agent import DisruptionAgent
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Output keys and the option attributes they are read from, in matching order
+_FLIGHT_KEYS = ("airline", "departure", "arrival", "price")
+_FLIGHT_FIELDS = attrgetter("airline", "departure_time", "arrival_time", "price")
+_HOTEL_KEYS = ("name", "location", "price_per_night", "rating")
+_HOTEL_FIELDS = attrgetter("name", "location", "price_per_night", "guest_rating")
+_ATTRACTION_KEYS = ("name", "category", "description", "price")
+_ATTRACTION_FIELDS = attrgetter("name", "category", "description", "price")
+_PRICE = attrgetter("price")
+_PRICE_PER_NIGHT = attrgetter("price_per_night")
+
+
+# Specialized agents keep no per-request state, so concierges built with the
+# same config share one instance of each, keyed by (agent class, config). The
+# pool is bounded so many distinct (e.g. per-tenant) configs cannot grow it
+# without limit: it holds the five agents of _AGENT_POOL_CONFIGS configs.
+_AGENT_POOL_CONFIGS = 16
+_AGENT_POOL_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=5 * _AGENT_POOL_CONFIGS)
+def _shared_agent(cls: type, config: Any) -> Any:
+    """Create the pooled agent of a class for a config"""
+    return cls(config)
+
+
+def _pooled_agent(cls: type, config: Any) -> Any:
+    """Return the shared agent of a class for a config, creating it once"""
+    try:
+        hash(config)
+    except TypeError:  # unhashable config: no sharing
+        return cls(config)
+    with _AGENT_POOL_LOCK:
+        return _shared_agent(cls, config)
+
+
+# One thread pool runs the independent agent searches for both the sync and
+# async request paths. Each request submits three searches, and the tasks
+# never submit further work, so a bounded pool cannot deadlock. Sized like
+# ThreadPoolExecutor's default for I/O-bound work; threads start on demand.
+_SEARCH_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+_search_executor: Optional[ThreadPoolExecutor] = None
+_search_executor_lock = threading.Lock()
+
+
+def _get_search_executor() -> ThreadPoolExecutor:
+    """Return the shared search pool, creating it on first use or after shutdown"""
+    global _search_executor
+    with _search_executor_lock:
+        if _search_executor is None:
+            _search_executor = ThreadPoolExecutor(
+                max_workers=_SEARCH_WORKERS, thread_name_prefix="concierge"
+            )
+        return _search_executor
+
+
+def shutdown_search_executor(wait: bool = True) -> None:
+    """Shut down the shared search pool, e.g. when the application stops
+    
+    Args:
+        wait: Whether to wait for running searches to finish
+    """
+    global _search_executor
+    with _search_executor_lock:
+        executor, _search_executor = _search_executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+@lru_cache(maxsize=1024)
+def _trip_dates(start_date: str, end_date: str) -> Tuple[date, date, int]:
+    """Parse two ISO dates once
+    
+    Returns:
+        Tuple of (start date, end date, number of days inclusive)
+    """
+    start = date.fromisoformat(start_date)
+    end = date.fromisoformat(end_date)
+    return start, end, (end - start).days + 1
+
+
+@dataclass(slots=True)
 class TravelRequest:
     """Data class for travel requests"""
     destination: str
@@ -31,7 +119,7 @@ class TravelRequest:
     travelers: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class TravelItinerary:
     """Data class for travel itinerary"""
     destination: str
@@ -57,15 +145,47 @@ class TravelConcierge:
         """
         self.config = config
         self.initialized_at = datetime.now()
+        self._init_iso = self.initialized_at.isoformat()
         
-        # Initialize specialized agents
-        self.flight_agent = FlightAgent(config)
-        self.hotel_agent = HotelAgent(config)
-        self.attraction_agent = AttractionAgent(config)
-        self.itinerary_agent = ItineraryAgent(config)
-                self.disruption_agent = DisruptionAgent(config)
+        # Specialized agents are created on first use unless eager init is requested
+        if getattr(config, "eager_init", False):
+            self.flight_agent
+            self.hotel_agent
+            self.attraction_agent
+            self.itinerary_agent
+            self.disruption_agent
         
-        logger.info("TravelConcierge initialized with all agents")
+        logger.info("TravelConcierge initialized")
+    
+    @cached_property
+    def flight_agent(self) -> "FlightAgent":
+        """Flight search agent"""
+        from .flight_agent import FlightAgent
+        return _pooled_agent(FlightAgent, self.config)
+    
+    @cached_property
+    def hotel_agent(self) -> "HotelAgent":
+        """Hotel search agent"""
+        from .hotel_agent import HotelAgent
+        return _pooled_agent(HotelAgent, self.config)
+    
+    @cached_property
+    def attraction_agent(self) -> "AttractionAgent":
+        """Attraction discovery agent"""
+        from .attraction_agent import AttractionAgent
+        return _pooled_agent(AttractionAgent, self.config)
+    
+    @cached_property
+    def itinerary_agent(self) -> "ItineraryAgent":
+        """Itinerary planning agent"""
+        from .itinerary_agent import ItineraryAgent
+        return _pooled_agent(ItineraryAgent, self.config)
+    
+    @cached_property
+    def disruption_agent(self) -> "DisruptionAgent":
+        """Disruption monitoring agent"""
+        from .disruption_agent import DisruptionAgent
+        return _pooled_agent(DisruptionAgent, self.config)
     
     def process_request(self, request: TravelRequest) -> TravelItinerary:
         """Process a travel request and generate an itinerary
@@ -78,66 +198,105 @@ class TravelConcierge:
         """
         logger.info(f"Processing travel request for {request.destination}")
         
-        # Calculate duration
-        duration = self._calculate_duration(request.start_date, request.end_date)
-        
-        # Search for flights if origin is provided
-        flights = []
-        if request.origin:
-            flight_options = self.flight_agent.search_flights(
-                origin=request.origin,
-                destination=request.destination,
-                departure_date=request.start_date,
-                passengers=request.travelers
-            )
-            flights = [
-                {
-                    "airline": f.airline,
-                    "departure": f.departure_time,
-                    "arrival": f.arrival_time,
-                    "price": f.price
-                }
-                for f in flight_options
-            ]
-        
-        # Search for accommodations
-        hotel_options = self.hotel_agent.search_hotels(
+        # The searches are independent, so run them concurrently
+        executor = _get_search_executor()
+        flights_future = executor.submit(self._search_flights, request)
+        hotels_future = executor.submit(self._search_hotels, request)
+        attractions_future = executor.submit(self._discover_attractions, request)
+        
+        flight_options = flights_future.result()
+        hotel_options = hotels_future.result()
+        attraction_options = attractions_future.result()
+        
+        return self._build_itinerary(
+            request, flight_options, hotel_options, attraction_options
+        )
+    
+    async def process_request_async(self, request: TravelRequest) -> TravelItinerary:
+        """Process a travel request, running the independent agent searches concurrently
+        
+        Args:
+            request: TravelRequest object with travel details
+            
+        Returns:
+            TravelItinerary: Comprehensive travel itinerary
+        """
+        logger.info(f"Processing travel request for {request.destination}")
+        
+        loop = asyncio.get_running_loop()
+        executor = _get_search_executor()
+        flight_options, hotel_options, attraction_options = await asyncio.gather(
+            loop.run_in_executor(executor, self._search_flights, request),
+            loop.run_in_executor(executor, self._search_hotels, request),
+            loop.run_in_executor(executor, self._discover_attractions, request)
+        )
+        
+        return self._build_itinerary(
+            request, flight_options, hotel_options, attraction_options
+        )
+    
+    def _search_flights(self, request: TravelRequest) -> List["FlightOption"]:
+        """Search for flights if an origin is provided"""
+        if not request.origin:
+            return []
+        return self.flight_agent.search_flights(
+            origin=request.origin,
+            destination=request.destination,
+            departure_date=request.start_date,
+            passengers=request.travelers
+        )
+    
+    def _search_hotels(self, request: TravelRequest) -> List["HotelOption"]:
+        """Search for accommodations"""
+        return self.hotel_agent.search_hotels(
             destination=request.destination,
             check_in=request.start_date,
             check_out=request.end_date,
             guests=request.travelers
         )
-        accommodations = [
-            {
-                "name": h.name,
-                "location": h.location,
-                "price_per_night": h.price_per_night,
-                "rating": h.guest_rating
-            }
-            for h in hotel_options
-        ]
-        
-        # Discover attractions
+    
+    def _discover_attractions(self, request: TravelRequest) -> List["Attraction"]:
+        """Discover attractions matching the requested categories"""
         categories = request.preferences.get("attraction_types") if request.preferences else None
-        attraction_options = self.attraction_agent.discover_attractions(
+        return self.attraction_agent.discover_attractions(
             destination=request.destination,
             categories=categories
         )
+    
+    def _build_itinerary(
+        self,
+        request: TravelRequest,
+        flight_options: List["FlightOption"],
+        hotel_options: List["HotelOption"],
+        attraction_options: List["Attraction"]
+    ) -> TravelItinerary:
+        """Combine agent search results into a complete itinerary
+        
+        Args:
+            request: TravelRequest object with travel details
+            flight_options: Flights found for the request
+            hotel_options: Hotels found for the request
+            attraction_options: Attractions found for the request
+            
+        Returns:
+            TravelItinerary: Comprehensive travel itinerary
+        """
+        # Parse dates once and calculate duration
+        start, end, duration = _trip_dates(request.start_date, request.end_date)
+        
+        flights = [dict(zip(_FLIGHT_KEYS, _FLIGHT_FIELDS(f))) for f in flight_options]
+        accommodations = [
+            dict(zip(_HOTEL_KEYS, _HOTEL_FIELDS(h))) for h in hotel_options
+        ]
         attractions = [
-            {
-                "name": a.name,
-                "category": a.category,
-                "description": a.description,
-                "price": a.price
-            }
-            for a in attraction_options
+            dict(zip(_ATTRACTION_KEYS, _ATTRACTION_FIELDS(a))) for a in attraction_options
         ]
         
         # Create itinerary with attractions
         itinerary_obj = self.itinerary_agent.create_itinerary(
             destination=request.destination,
-            start_date=request.start_date,
-            end_date=request.end_date,
+            start_date=start,
+            end_date=end,
             attractions=attraction_options,
             preferences=request.preferences
         )
@@ -152,14 +311,13 @@ class TravelConcierge:
         
         # Calculate total estimated cost
         total_cost = 0.0
-        if flights:
-            total_cost += min(f["price"] for f in flights)
-        if accommodations:
-            best_hotel = self.hotel_agent.get_best_hotel(hotel_options, "price")
-            if best_hotel:
-                total_cost += self.hotel_agent.calculate_total_cost(
-                    best_hotel, duration
-                )
+        if flight_options:
+            total_cost += min(map(_PRICE, flight_options))
+        if hotel_options:
+            cheapest_hotel = min(hotel_options, key=_PRICE_PER_NIGHT)
+            total_cost += self.hotel_agent.calculate_total_cost(
+                cheapest_hotel, duration
+            )
         total_cost += self.attraction_agent.calculate_activities_cost(attraction_options)
         
         # Create final itinerary
@@ -175,6 +333,86 @@ class TravelConcierge:
         
         return travel_itinerary
     
+    def process_batch(self, requests: List[TravelRequest]) -> List[TravelItinerary]:
+        """Process several travel requests together
+        
+        Identical requests within the batch are planned once; repeats get
+        their own copy of the itinerary.
+        
+        Args:
+            requests: TravelRequest objects to process
+            
+        Returns:
+            List of TravelItinerary objects, in the same order as requests
+        """
+        logger.info(f"Processing batch of {len(requests)} travel requests")
+        
+        planned: Dict[tuple, TravelItinerary] = {}
+        itineraries = []
+        for request in requests:
+            key = self._request_key(request)
+            if key in planned:
+                itineraries.append(copy.deepcopy(planned[key]))
+            else:
+                planned[key] = self.process_request(request)
+                itineraries.append(planned[key])
+        
+        return itineraries
+    
+    async def process_batch_async(
+        self,
+        requests: List[TravelRequest],
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """Process several travel requests together, planning them concurrently
+        
+        Identical requests within the batch are planned once; repeats get
+        their own copy of the itinerary.
+        
+        Args:
+            requests: TravelRequest objects to process
+            return_exceptions: If True, a failed request's slot holds its
+                exception instead of the first failure being raised
+            
+        Returns:
+            List of TravelItinerary objects (or exceptions), in the same order as requests
+        """
+        logger.info(f"Processing batch of {len(requests)} travel requests")
+        
+        unique: Dict[tuple, TravelRequest] = {}
+        for request in requests:
+            unique.setdefault(self._request_key(request), request)
+        
+        results = await asyncio.gather(
+            *(self.process_request_async(request) for request in unique.values()),
+            return_exceptions=return_exceptions
+        )
+        planned = dict(zip(unique, results))
+        
+        itineraries = []
+        handed_out = set()
+        for request in requests:
+            key = self._request_key(request)
+            result = planned[key]
+            if key in handed_out and isinstance(result, TravelItinerary):
+                result = copy.deepcopy(result)
+            handed_out.add(key)
+            itineraries.append(result)
+        
+        return itineraries
+    
+    def _request_key(self, request: TravelRequest) -> tuple:
+        """Build a hashable key identifying equivalent travel requests"""
+        return (
+            request.destination,
+            request.start_date,
+            request.end_date,
+            request.origin,
+            request.budget,
+            request.travelers,
+            json.dumps(request.preferences, sort_keys=True, default=str)
+        )
+    
     def _calculate_duration(self, start_date: str, end_date: str) -> int:
         """Calculate duration between dates
         
@@ -185,21 +423,19 @@ class TravelConcierge:
         Returns:
             Number of days between dates (inclusive)
         """
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d")
-        return (end - start).days + 1
+        return _trip_dates(start_date, end_date)[2]
     
     def get_status(self) -> Dict[str, Any]:
         """Get current agent status"""
         return {
             "status": "active",
-            "initialized_at": self.initialized_at.isoformat(),
+            "initialized_at": self._init_iso,
             "version": "1.0.0",
             "agents": {
                 "flight": self.flight_agent.get_status(),
                 "hotel": self.hotel_agent.get_status(),
                 "attraction": self.attraction_agent.get_status(),
-                "itinerary": self.itinerary_agent.get_status()
-                                "disruption": self.disruption_agent.get_status()
+                "itinerary": self.itinerary_agent.get_status(),
+                "disruption": self.disruption_agent.get_status()
             }
         }
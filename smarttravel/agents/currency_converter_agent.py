@@ -5,14 +5,64 @@ and providing budget estimates in multiple currencies for international trips.
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+import sys
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Sequence, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _canonical_code(code: str) -> str:
+    """Upper-case and intern a currency code"""
+    return sys.intern(code.upper())
+
+
+def _rate_tables(rates: Mapping[str, float]) -> Tuple[Dict[str, int], np.ndarray]:
+    """Build the currency index and read-only pairwise rate matrix for a rate table
+    
+    Currencies missing from the table map to a trailing rate of 1.0.
+    """
+    index = {currency: i for i, currency in enumerate(rates)}
+    to_inr = np.array([*rates.values(), 1.0], dtype=np.float64)
+    pair_rates = np.divide.outer(to_inr, to_inr)
+    pair_rates.flags.writeable = False
+    return index, pair_rates
+
+
+def _alias_tables(
+    destinations: Mapping[str, str]
+) -> Tuple[Tuple[Tuple[str, str], ...], Dict[str, str]]:
+    """Build lowercased (alias, currency) pairs, in table order, and an exact-match dict"""
+    aliases = tuple((location.lower(), currency) for location, currency in destinations.items())
+    return aliases, dict(aliases)
+
+
+# Currency tips that apply to every destination
+_GENERAL_TIPS = (
+    "Notify your bank before traveling internationally",
+    "Use credit cards with no foreign transaction fees",
+    "Avoid airport currency exchanges (poor rates)",
+    "Use ATMs for better exchange rates than currency counters",
+    "Keep some cash for small vendors who don't accept cards",
+)
+
+# Features reported by get_status
+_STATUS_FEATURES = (
+    "currency_conversion",
+    "multi_currency_budgeting",
+    "exchange_rates",
+    "destination_currency_detection",
+    "daily_cost_estimation",
+)
+
+
 class Currency(Enum):
     """Major world currencies"""
     USD = "USD"  # US Dollar
@@ -31,7 +81,7 @@ class Currency(Enum):
     KRW = "KRW"  # South Korean Won
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExchangeRate:
     """Exchange rate information"""
     from_currency: str
@@ -44,7 +94,7 @@ class ExchangeRate:
         return amount * self.rate
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CurrencyConversion:
     """Result of a currency conversion"""
     original_amount: float
@@ -58,7 +108,7 @@ class CurrencyConversion:
         return f"{self.original_amount:.2f} {self.original_currency} = {self.converted_amount:.2f} {self.converted_currency}"
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiBudgetBreakdown:
     """Budget breakdown in multiple currencies"""
     base_amount: float
@@ -79,8 +129,10 @@ class CurrencyConverterAgent:
     understand costs in different currencies for international trips.
     """
     
-    # Approximate exchange rates (to INR) - In production, use live API
-    EXCHANGE_RATES = {
+    # Approximate exchange rates (to INR) - In production, use live API.
+    # Read-only: the lookup tables below are derived from it once per class,
+    # so subclasses override the whole table instead of editing it in place
+    EXCHANGE_RATES: Mapping[str, float] = MappingProxyType({
         "USD": 83.12,  # 1 USD = 83.12 INR
         "EUR": 90.45,  # 1 EUR = 90.45 INR
         "GBP": 105.32,  # 1 GBP = 105.32 INR
@@ -95,10 +147,16 @@ class CurrencyConverterAgent:
         "MYR": 18.67,  # 1 MYR = 18.67 INR
         "THB": 2.35,   # 1 THB = 2.35 INR
         "KRW": 0.063,  # 1 KRW = 0.063 INR
-    }
+    })
+    
+    # Position of each currency in _PAIR_RATES, where _PAIR_RATES[i, j] converts
+    # currency i into currency j; unknown currencies use _UNKNOWN_INDEX
+    _CURRENCY_INDEX, _PAIR_RATES = _rate_tables(EXCHANGE_RATES)
+    _UNKNOWN_INDEX = len(EXCHANGE_RATES)
     
-    # Popular tourist destinations and their currencies
-    DESTINATION_CURRENCIES = {
+    # Popular tourist destinations and their currencies; read-only like
+    # EXCHANGE_RATES, with the alias tables below derived from it
+    DESTINATION_CURRENCIES: Mapping[str, str] = MappingProxyType({
         "USA": "USD",
         "United States": "USD",
         "Europe": "EUR",
@@ -120,8 +178,28 @@ class CurrencyConverterAgent:
         "Bangkok": "THB",
         "South Korea": "KRW",
         "Seoul": "KRW",
+    })
+    
+    # Daily cost categories and base estimates in USD per budget tier
+    _DAILY_COST_CATEGORIES = ("accommodation", "food", "transportation", "activities", "total")
+    _DAILY_COSTS_USD = {
+        "budget": np.array([30, 20, 10, 15, 75], dtype=np.float64),
+        "mid_range": np.array([80, 50, 25, 45, 200], dtype=np.float64),
+        "luxury": np.array([200, 100, 50, 100, 450], dtype=np.float64),
     }
     
+    # Lowercased destination aliases, in DESTINATION_CURRENCIES order
+    _DESTINATION_ALIASES, _DESTINATION_EXACT = _alias_tables(DESTINATION_CURRENCIES)
+    
+    def __init_subclass__(cls, **kwargs):
+        """Freeze a subclass's rate and destination tables and derive its lookup tables"""
+        super().__init_subclass__(**kwargs)
+        cls.EXCHANGE_RATES = MappingProxyType(dict(cls.EXCHANGE_RATES))
+        cls._CURRENCY_INDEX, cls._PAIR_RATES = _rate_tables(cls.EXCHANGE_RATES)
+        cls._UNKNOWN_INDEX = len(cls.EXCHANGE_RATES)
+        cls.DESTINATION_CURRENCIES = MappingProxyType(dict(cls.DESTINATION_CURRENCIES))
+        cls._DESTINATION_ALIASES, cls._DESTINATION_EXACT = _alias_tables(cls.DESTINATION_CURRENCIES)
+    
     def __init__(self, config=None):
         """Initialize the Currency Converter Agent
         
@@ -130,6 +208,7 @@ class CurrencyConverterAgent:
         """
         self.config = config
         self.initialized_at = datetime.now()
+        self._init_iso = self.initialized_at.isoformat()
         logger.info("CurrencyConverterAgent initialized")
     
     def convert(
@@ -148,30 +227,48 @@ class CurrencyConverterAgent:
         Returns:
             CurrencyConversion with conversion details
         """
-        from_currency = from_currency.upper()
-        to_currency = to_currency.upper()
+        from_currency = _canonical_code(from_currency)
+        to_currency = _canonical_code(to_currency)
         
         logger.info(f"Converting {amount} {from_currency} to {to_currency}")
         
-        # Get exchange rates to INR
-        from_rate = self.EXCHANGE_RATES.get(from_currency, 1.0)
-        to_rate = self.EXCHANGE_RATES.get(to_currency, 1.0)
-        
-        # Convert: amount -> INR -> target currency
-        amount_in_inr = amount * from_rate
-        converted_amount = amount_in_inr / to_rate
-        
-        # Exchange rate (direct from source to target)
-        exchange_rate = from_rate / to_rate
+        exchange_rate = self._pair_rate(from_currency, to_currency)
         
         return CurrencyConversion(
             original_amount=amount,
             original_currency=from_currency,
-            converted_amount=converted_amount,
+            converted_amount=amount * exchange_rate,
             converted_currency=to_currency,
             exchange_rate=exchange_rate
         )
     
+    def convert_many(
+        self,
+        amounts: Sequence[float],
+        from_currency: str,
+        to_currency: str
+    ) -> np.ndarray:
+        """Convert many amounts between the same pair of currencies
+        
+        Args:
+            amounts: Amounts to convert
+            from_currency: Source currency code (e.g., 'USD')
+            to_currency: Target currency code (e.g., 'INR')
+        
+        Returns:
+            Array of converted amounts, in the same order as amounts
+        """
+        rate = self._pair_rate(_canonical_code(from_currency), _canonical_code(to_currency))
+        return np.asarray(amounts, dtype=np.float64) * rate
+    
+    def _pair_rate(self, from_currency: str, to_currency: str) -> float:
+        """Look up the direct exchange rate between two upper-case currency codes"""
+        index = self._CURRENCY_INDEX.get
+        return self._PAIR_RATES.item(
+            index(from_currency, self._UNKNOWN_INDEX),
+            index(to_currency, self._UNKNOWN_INDEX)
+        )
+    
     def get_destination_currency(self, destination: str) -> Optional[str]:
         """Get the primary currency for a destination
         
@@ -181,17 +278,21 @@ class CurrencyConverterAgent:
         Returns:
             Currency code or None if not found
         """
-        # Check exact matches first
-        if destination in self.DESTINATION_CURRENCIES:
-            return self.DESTINATION_CURRENCIES[destination]
-        
-        # Check case-insensitive partial matches
+        # Check case-insensitive exact matches first
         destination_lower = destination.lower()
-        for location, currency in self.DESTINATION_CURRENCIES.items():
-            if location.lower() in destination_lower or destination_lower in location.lower():
-                return currency
+        currency = self._DESTINATION_EXACT.get(destination_lower)
+        if currency is not None:
+            return currency
         
-        return None
+        # Check case-insensitive partial matches
+        return next(
+            (
+                currency
+                for location, currency in self._DESTINATION_ALIASES
+                if location in destination_lower or destination_lower in location
+            ),
+            None
+        )
     
     def convert_budget_to_destination(
         self,
@@ -233,21 +334,30 @@ class CurrencyConverterAgent:
         Returns:
             MultiBudgetBreakdown with conversions
         """
+        base_currency = _canonical_code(base_currency)
         breakdown = MultiBudgetBreakdown(
             base_amount=amount,
-            base_currency=base_currency.upper()
+            base_currency=base_currency
         )
         
-        for currency in target_currencies:
-            if currency.upper() == base_currency.upper():
-                continue
-            
-            conversion = self.convert(amount, base_currency, currency)
-            breakdown.add_conversion(
-                currency.upper(),
-                conversion.converted_amount,
-                conversion.exchange_rate
-            )
+        targets = [_canonical_code(currency) for currency in target_currencies]
+        targets = [currency for currency in targets if currency != base_currency]
+        if not targets:
+            return breakdown
+        
+        # Gather target rates and convert all currencies at once
+        indices = np.fromiter(
+            (self._CURRENCY_INDEX.get(currency, self._UNKNOWN_INDEX) for currency in targets),
+            dtype=np.intp,
+            count=len(targets)
+        )
+        rates = self._PAIR_RATES[
+            self._CURRENCY_INDEX.get(base_currency, self._UNKNOWN_INDEX), indices
+        ]
+        converted = amount * rates
+        
+        for currency, converted_amount, rate in zip(targets, converted.tolist(), rates.tolist()):
+            breakdown.add_conversion(currency, converted_amount, rate)
         
         return breakdown
     
@@ -267,41 +377,14 @@ class CurrencyConverterAgent:
         """
         dest_currency = self.get_destination_currency(destination) or "USD"
         
-        # Base estimates in USD (can be converted)
-        estimates = {
-            "budget": {
-                "accommodation": 30,
-                "food": 20,
-                "transportation": 10,
-                "activities": 15,
-                "total": 75
-            },
-            "mid_range": {
-                "accommodation": 80,
-                "food": 50,
-                "transportation": 25,
-                "activities": 45,
-                "total": 200
-            },
-            "luxury": {
-                "accommodation": 200,
-                "food": 100,
-                "transportation": 50,
-                "activities": 100,
-                "total": 450
-            }
-        }
-        
-        base_estimate = estimates.get(budget_tier, estimates["mid_range"])
+        # Convert the tier's USD estimates to destination currency in one pass
+        base_estimate = self._DAILY_COSTS_USD.get(budget_tier, self._DAILY_COSTS_USD["mid_range"])
+        amounts = np.round(base_estimate * self._pair_rate("USD", dest_currency), 2)
         
-        # Convert to destination currency
-        converted_estimate = {}
-        for category, usd_amount in base_estimate.items():
-            conversion = self.convert(usd_amount, "USD", dest_currency)
-            converted_estimate[category] = {
-                "amount": round(conversion.converted_amount, 2),
-                "currency": dest_currency
-            }
+        converted_estimate = {
+            category: {"amount": amount, "currency": dest_currency}
+            for category, amount in zip(self._DAILY_COST_CATEGORIES, amounts.tolist())
+        }
         
         return {
             "destination": destination,
@@ -324,18 +407,13 @@ class CurrencyConverterAgent:
         Returns:
             ExchangeRate object
         """
-        from_currency = from_currency.upper()
-        to_currency = to_currency.upper()
-        
-        from_rate = self.EXCHANGE_RATES.get(from_currency, 1.0)
-        to_rate = self.EXCHANGE_RATES.get(to_currency, 1.0)
-        
-        rate = from_rate / to_rate
+        from_currency = _canonical_code(from_currency)
+        to_currency = _canonical_code(to_currency)
         
         return ExchangeRate(
             from_currency=from_currency,
             to_currency=to_currency,
-            rate=rate
+            rate=self._pair_rate(from_currency, to_currency)
         )
     
     def get_currency_tips(self, destination: str) -> List[str]:
@@ -349,31 +427,17 @@ class CurrencyConverterAgent:
         """
         dest_currency = self.get_destination_currency(destination)
         
-        general_tips = [
-            "Notify your bank before traveling internationally",
-            "Use credit cards with no foreign transaction fees",
-            "Avoid airport currency exchanges (poor rates)",
-            "Use ATMs for better exchange rates than currency counters",
-            "Keep some cash for small vendors who don't accept cards"
-        ]
-        
         if dest_currency:
-            general_tips.insert(0, f"The local currency in {destination} is {dest_currency}")
+            return [f"The local currency in {destination} is {dest_currency}", *_GENERAL_TIPS]
         
-        return general_tips
+        return list(_GENERAL_TIPS)
     
     def get_status(self) -> Dict[str, Any]:
         """Get current agent status"""
         return {
             "agent": "CurrencyConverterAgent",
             "status": "active",
-            "initialized_at": self.initialized_at.isoformat(),
+            "initialized_at": self._init_iso,
             "supported_currencies": len(self.EXCHANGE_RATES),
-            "features": [
-                "currency_conversion",
-                "multi_currency_budgeting",
-                "exchange_rates",
-                "destination_currency_detection",
-                "daily_cost_estimation"
-            ]
+            "features": list(_STATUS_FEATURES)
         }
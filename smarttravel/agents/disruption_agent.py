@@ -4,7 +4,7 @@ Specialized agent for detecting travel disruptions (flight cancellations, delays
 weather events, etc.) and generating revised itineraries.
 """
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -24,14 +24,50 @@ class DisruptionType(Enum):
 
 
 class DisruptionSeverity(Enum):
-    """Severity levels for disruptions"""
-    LOW = "low"          # Minor inconvenience, easy workaround
-    MEDIUM = "medium"    # Requires replanning, moderate impact
-    HIGH = "high"        # Significant impact, major replanning needed
-    CRITICAL = "critical" # Trip-ending issue, immediate action required
+    """Severity levels for disruptions, with their risk score weight"""
+    LOW = ("low", 10)            # Minor inconvenience, easy workaround
+    MEDIUM = ("medium", 30)      # Requires replanning, moderate impact
+    HIGH = ("high", 60)          # Significant impact, major replanning needed
+    CRITICAL = ("critical", 100) # Trip-ending issue, immediate action required
+    
+    weight: int
+    
+    def __new__(cls, value: str, weight: int):
+        member = object.__new__(cls)
+        member._value_ = value
+        member.weight = weight
+        return member
 
 
-@dataclass
+# Severities that force replanning
+_REPLAN_LEVELS = frozenset({DisruptionSeverity.HIGH, DisruptionSeverity.CRITICAL})
+
+# Actionable recommendations for each disruption type
+_RECOMMENDATIONS_BY_TYPE: Dict[DisruptionType, Tuple[str, ...]] = {
+    DisruptionType.FLIGHT_CANCELLED: (
+        "Contact airline immediately for rebooking options",
+        "Consider flexible accommodation if arrival is delayed",
+    ),
+    DisruptionType.SEVERE_WEATHER: (
+        "Have backup indoor activities planned",
+        "Check local weather alerts regularly",
+    ),
+    DisruptionType.ATTRACTION_CLOSED: (
+        "Research alternative attractions in the area",
+    ),
+}
+
+
+# Indoor alternatives used when weather disrupts a day
+_INDOOR_ACTIVITIES = (
+    "Visit local museum",
+    "Explore art gallery",
+    "Indoor market tour",
+    "Cooking class",
+)
+
+
+@dataclass(slots=True)
 class Disruption:
     """Data class for a single disruption"""
     disruption_type: DisruptionType
@@ -40,9 +76,9 @@ class Disruption:
     description: str
     affected_components: List[str] = field(default_factory=list)  # e.g., ["flight", "hotel"]
     detected_at: datetime = field(default_factory=datetime.now)
-    
 
-@dataclass
+
+@dataclass(slots=True)
 class DisruptionReport:
     """Complete report of all disruptions found"""
     disruptions: List[Disruption] = field(default_factory=list)
@@ -81,6 +117,7 @@ class DisruptionAgent:
         """
         self.config = config
         self.initialized_at = datetime.now()
+        self._init_iso = self.initialized_at.isoformat()
         logger.info("DisruptionAgent initialized")
     
     def detect_disruptions(
@@ -139,18 +176,12 @@ class DisruptionAgent:
                 )
             )
         
-        # Calculate risk score
-        risk_score = self._calculate_risk_score(disruptions)
+        # Calculate risk score and determine if replanning is required
+        risk_score, requires_replanning = self._assess_severity(disruptions)
         
         # Generate recommendations
         recommendations = self._generate_recommendations(disruptions)
         
-        # Determine if replanning is required
-        requires_replanning = any(
-            d.severity in [DisruptionSeverity.HIGH, DisruptionSeverity.CRITICAL]
-            for d in disruptions
-        )
-        
         return DisruptionReport(
             disruptions=disruptions,
             risk_score=risk_score,
@@ -233,32 +264,24 @@ class DisruptionAgent:
             revision_notes=revision_notes
         )
     
-    def _calculate_risk_score(self, disruptions: List[Disruption]) -> float:
-        """Calculate overall risk score from disruptions
+    def _assess_severity(self, disruptions: List[Disruption]) -> Tuple[float, bool]:
+        """Calculate risk score and replanning need in a single pass
         
         Args:
             disruptions: List of detected disruptions
         
         Returns:
-            Risk score from 0-100
+            Tuple of (risk score from 0-100, whether replanning is required)
         """
-        if not disruptions:
-            return 0.0
-        
-        severity_weights = {
-            DisruptionSeverity.LOW: 10,
-            DisruptionSeverity.MEDIUM: 30,
-            DisruptionSeverity.HIGH: 60,
-            DisruptionSeverity.CRITICAL: 100
-        }
-        
-        total_score = sum(
-            severity_weights.get(d.severity, 0)
-            for d in disruptions
-        )
+        total_score = 0
+        requires_replanning = False
+        for d in disruptions:
+            total_score += d.severity.weight
+            if d.severity in _REPLAN_LEVELS:
+                requires_replanning = True
         
         # Cap at 100
-        return min(total_score, 100.0)
+        return min(float(total_score), 100.0), requires_replanning
     
     def _generate_recommendations(self, disruptions: List[Disruption]) -> List[str]:
         """Generate actionable recommendations based on disruptions
@@ -267,33 +290,16 @@ class DisruptionAgent:
             disruptions: List of detected disruptions
         
         Returns:
-            List of recommendation strings
+            List of unique recommendation strings, in first-seen order
         """
-        recommendations = []
-        
+        # Ordered set of recommendations, so repeated disruption types add nothing new
+        recommendations: Dict[str, None] = {}
         for disruption in disruptions:
-            if disruption.disruption_type == DisruptionType.FLIGHT_CANCELLED:
-                recommendations.append(
-                    "Contact airline immediately for rebooking options"
-                )
-                recommendations.append(
-                    "Consider flexible accommodation if arrival is delayed"
-                )
-            
-            elif disruption.disruption_type == DisruptionType.SEVERE_WEATHER:
-                recommendations.append(
-                    "Have backup indoor activities planned"
-                )
-                recommendations.append(
-                    "Check local weather alerts regularly"
-                )
-            
-            elif disruption.disruption_type == DisruptionType.ATTRACTION_CLOSED:
-                recommendations.append(
-                    "Research alternative attractions in the area"
-                )
+            recommendations.update(
+                dict.fromkeys(_RECOMMENDATIONS_BY_TYPE.get(disruption.disruption_type, ()))
+            )
         
-        return recommendations
+        return list(recommendations)
     
     def _find_alternative_flights(self, original_flights: List[Dict]) -> List[Dict]:
         """Find alternative flights (mock implementation)
@@ -345,24 +351,22 @@ class DisruptionAgent:
         Returns:
             Modified schedule with indoor activities
         """
-        # Mock implementation
-        adjusted = daily_schedule.copy()
-        for day in adjusted:
-            if day.get("date") == affected_date:
-                # Replace with indoor activities
-                day["activities"] = [
-                    "Visit local museum",
-                    "Explore art gallery",
-                    "Indoor market tour",
-                    "Cooking class"
-                ]
-                day["weather_note"] = "Schedule adjusted for indoor activities"
-        return adjusted
+        # Mock implementation - rebuild only the affected days, sharing the rest
+        return [
+            {
+                **day,
+                "activities": list(_INDOOR_ACTIVITIES),
+                "weather_note": "Schedule adjusted for indoor activities"
+            }
+            if day.get("date") == affected_date
+            else day
+            for day in daily_schedule
+        ]
     
     def get_status(self) -> Dict[str, Any]:
         """Get current agent status"""
         return {
             "agent": "DisruptionAgent",
             "status": "active",
-            "initialized_at": self.initialized_at.isoformat()
-        
+            "initialized_at": self._init_iso
+        }
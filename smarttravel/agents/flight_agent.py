@@ -4,14 +4,35 @@ Specialized agent for finding and recommending flight options.
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# FlightOption attribute (and FlightBatch column) for each get_best_flight preference
+_PREFERENCE_COLUMNS = {
+    "price": "price",
+    "duration": "duration_hours",
+    "stops": "stops",
+}
+
+# Sort key for each preference, derived from the table above
+_PREFERENCE_KEYS = {
+    preference: attrgetter(column) for preference, column in _PREFERENCE_COLUMNS.items()
+}
+
+# Mock schedule: (airline, departure time, arrival time, price per passenger, duration, stops)
+_MOCK_FLIGHTS = (
+    ("Mock Airlines", "08:00:00", "12:00:00", 350.0, 4.0, 0),
+    ("Budget Air", "14:00:00", "20:00:00", 200.0, 6.0, 1),
+)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class FlightOption:
     """Data class for flight options"""
     airline: str
@@ -24,6 +45,39 @@ class FlightOption:
     stops: int = 0
 
 
+@dataclass(slots=True)
+class FlightBatch:
+    """Column-oriented set of flight options between two cities
+    
+    Times are stored as datetime64[s] (epoch seconds); FlightOption objects
+    are only built for the rows that are actually picked.
+    """
+    departure_city: str
+    arrival_city: str
+    airline: np.ndarray
+    departure_time: np.ndarray
+    arrival_time: np.ndarray
+    price: np.ndarray
+    duration_hours: np.ndarray
+    stops: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.price)
+    
+    def option(self, index: int) -> FlightOption:
+        """Materialize a single row as a FlightOption"""
+        return FlightOption(
+            airline=self.airline[index],
+            departure_city=self.departure_city,
+            arrival_city=self.arrival_city,
+            departure_time=str(self.departure_time[index]),
+            arrival_time=str(self.arrival_time[index]),
+            price=self.price.item(index),
+            duration_hours=self.duration_hours.item(index),
+            stops=self.stops.item(index)
+        )
+
+
 class FlightAgent:
     """Agent specialized in flight search and recommendations
     
@@ -39,6 +93,7 @@ class FlightAgent:
         """
         self.config = config
         self.initialized_at = datetime.now()
+        self._init_iso = self.initialized_at.isoformat()
         logger.info("FlightAgent initialized")
     
     def search_flights(
@@ -66,59 +121,86 @@ class FlightAgent:
         # Mock implementation - in production, this would call flight APIs
         flights = [
             FlightOption(
-                airline="Mock Airlines",
+                airline=airline,
                 departure_city=origin,
                 arrival_city=destination,
-                departure_time=f"{departure_date}T08:00:00",
-                arrival_time=f"{departure_date}T12:00:00",
-                price=350.0 * passengers,
-                duration_hours=4.0,
-                stops=0
-            ),
-            FlightOption(
-                airline="Budget Air",
-                departure_city=origin,
-                arrival_city=destination,
-                departure_time=f"{departure_date}T14:00:00",
-                arrival_time=f"{departure_date}T20:00:00",
-                price=200.0 * passengers,
-                duration_hours=6.0,
-                stops=1
+                departure_time=f"{departure_date}T{departs}",
+                arrival_time=f"{departure_date}T{arrives}",
+                price=price * passengers,
+                duration_hours=duration,
+                stops=stops
             )
+            for airline, departs, arrives, price, duration, stops in _MOCK_FLIGHTS
         ]
         
         return flights
     
+    def search_flights_batch(
+        self,
+        origin: str,
+        destination: str,
+        departure_date: str,
+        passengers: int = 1
+    ) -> FlightBatch:
+        """Search for available flights, returning them as a column-oriented batch
+        
+        Args:
+            origin: Departure city or airport code
+            destination: Arrival city or airport code
+            departure_date: Date of departure (YYYY-MM-DD)
+            passengers: Number of passengers
+            
+        Returns:
+            FlightBatch with one row per available flight
+        """
+        logger.info(f"Searching flights from {origin} to {destination}")
+        
+        # Mock implementation - in production, this would call flight APIs
+        airlines, departs, arrives, prices, durations, stops = zip(*_MOCK_FLIGHTS)
+        return FlightBatch(
+            departure_city=origin,
+            arrival_city=destination,
+            airline=np.array(airlines, dtype=object),
+            departure_time=np.array(
+                [f"{departure_date}T{t}" for t in departs], dtype="datetime64[s]"
+            ),
+            arrival_time=np.array(
+                [f"{departure_date}T{t}" for t in arrives], dtype="datetime64[s]"
+            ),
+            price=np.array(prices, dtype=np.float64) * passengers,
+            duration_hours=np.array(durations, dtype=np.float64),
+            stops=np.array(stops, dtype=np.int64)
+        )
+    
     def get_best_flight(
         self,
-        flights: List[FlightOption],
+        flights: Union[List[FlightOption], FlightBatch],
         preference: str = "price"
     ) -> Optional[FlightOption]:
         """Get the best flight based on preference
         
         Args:
-            flights: List of flight options to choose from
+            flights: Flight options to choose from, as a list or FlightBatch
             preference: Sorting preference ('price', 'duration', 'stops')
             
         Returns:
             Best FlightOption based on preference, or None if no flights
         """
-        if not flights:
+        if not len(flights):
             return None
         
-        if preference == "price":
-            return min(flights, key=lambda f: f.price)
-        elif preference == "duration":
-            return min(flights, key=lambda f: f.duration_hours)
-        elif preference == "stops":
-            return min(flights, key=lambda f: f.stops)
+        if isinstance(flights, FlightBatch):
+            column = _PREFERENCE_COLUMNS.get(preference)
+            index = int(np.argmin(getattr(flights, column))) if column else 0
+            return flights.option(index)
         
-        return flights[0]
+        key = _PREFERENCE_KEYS.get(preference)
+        return min(flights, key=key) if key else flights[0]
     
     def get_status(self) -> Dict[str, Any]:
         """Get current agent status"""
         return {
             "agent": "FlightAgent",
             "status": "active",
-            "initialized_at": self.initialized_at.isoformat()
+            "initialized_at": self._init_iso
         }
@@ -4,21 +4,29 @@ Specialized agent for finding and recommending hotel accommodations.
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
+from operator import attrgetter
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Selection function and key for each get_best_hotel preference
+_PREFERENCE_CHOICES = {
+    "price": (min, attrgetter("price_per_night")),
+    "rating": (max, attrgetter("guest_rating")),
+    "stars": (max, attrgetter("star_rating")),
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class HotelOption:
     """Data class for hotel options"""
     name: str
     location: str
     star_rating: int
     price_per_night: float
-    amenities: List[str]
+    amenities: Tuple[str, ...]
     guest_rating: float = 0.0
     room_type: str = "Standard"
 
@@ -38,6 +46,7 @@ class HotelAgent:
         """
         self.config = config
         self.initialized_at = datetime.now()
+        self._init_iso = self.initialized_at.isoformat()
         logger.info("HotelAgent initialized")
     
     def search_hotels(
@@ -69,7 +78,7 @@ class HotelAgent:
                 location=f"Downtown {destination}",
                 star_rating=5,
                 price_per_night=250.0,
-                amenities=["WiFi", "Pool", "Spa", "Restaurant", "Gym"],
+                amenities=("WiFi", "Pool", "Spa", "Restaurant", "Gym"),
                 guest_rating=4.8,
                 room_type="Deluxe"
             ),
@@ -78,7 +87,7 @@ class HotelAgent:
                 location=f"Central {destination}",
                 star_rating=3,
                 price_per_night=95.0,
-                amenities=["WiFi", "Breakfast", "Parking"],
+                amenities=("WiFi", "Breakfast", "Parking"),
                 guest_rating=4.2,
                 room_type="Standard"
             ),
@@ -87,7 +96,7 @@ class HotelAgent:
                 location=f"{destination} Suburbs",
                 star_rating=2,
                 price_per_night=55.0,
-                amenities=["WiFi", "Parking"],
+                amenities=("WiFi", "Parking"),
                 guest_rating=3.8,
                 room_type="Basic"
             )
@@ -112,14 +121,12 @@ class HotelAgent:
         if not hotels:
             return None
         
-        if preference == "price":
-            return min(hotels, key=lambda h: h.price_per_night)
-        elif preference == "rating":
-            return max(hotels, key=lambda h: h.guest_rating)
-        elif preference == "stars":
-            return max(hotels, key=lambda h: h.star_rating)
+        choice = _PREFERENCE_CHOICES.get(preference)
+        if choice is None:
+            return hotels[0]
         
-        return hotels[0]
+        pick, key = choice
+        return pick(hotels, key=key)
     
     def calculate_total_cost(
         self,
@@ -144,5 +151,5 @@ class HotelAgent:
         return {
             "agent": "HotelAgent",
             "status": "active",
-            "initialized_at": self.initialized_at.isoformat()
+            "initialized_at": self._init_iso
         }
@@ -4,17 +4,37 @@ Specialized agent for creating comprehensive travel itineraries.
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+from bisect import insort
+from itertools import pairwise
+from typing import Dict, List, Any, Optional, Union
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
 # Default number of attractions to schedule per day when no attractions provided
 DEFAULT_ATTRACTIONS_PER_DAY = 2
 
+# Fixed meals bracketing every day; copied per day so days stay independent
+_BREAKFAST = {"time": "09:00", "type": "breakfast", "description": "Breakfast at hotel"}
+_DINNER = {"time": "19:00", "type": "dinner", "description": "Dinner at local restaurant"}
 
-@dataclass
+
+def _to_date(value: Union[str, date]) -> date:
+    """Convert a YYYY-MM-DD string (or date/datetime) to a date"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
+
+
+def _activity_time(activity: Dict[str, Any]) -> str:
+    """Sort key for activities; untimed activities go first"""
+    return activity.get("time", "00:00")
+
+
+@dataclass(slots=True)
 class DayPlan:
     """Data class for a single day's plan"""
     day_number: int
@@ -23,7 +43,7 @@ class DayPlan:
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Itinerary:
     """Data class for complete itinerary"""
     destination: str
@@ -49,13 +69,14 @@ class ItineraryAgent:
         """
         self.config = config
         self.initialized_at = datetime.now()
+        self._init_iso = self.initialized_at.isoformat()
         logger.info("ItineraryAgent initialized")
     
     def create_itinerary(
         self,
         destination: str,
-        start_date: str,
-        end_date: str,
+        start_date: Union[str, date],
+        end_date: Union[str, date],
         attractions: Optional[List[Any]] = None,
         preferences: Optional[Dict[str, Any]] = None
     ) -> Itinerary:
@@ -63,8 +84,8 @@ class ItineraryAgent:
         
         Args:
             destination: Travel destination
-            start_date: Trip start date (YYYY-MM-DD)
-            end_date: Trip end date (YYYY-MM-DD)
+            start_date: Trip start date (YYYY-MM-DD string or date)
+            end_date: Trip end date (YYYY-MM-DD string or date)
             attractions: List of attractions to include
             preferences: User preferences for pacing and style
             
@@ -74,8 +95,8 @@ class ItineraryAgent:
         logger.info(f"Creating itinerary for {destination}")
         
         # Calculate number of days
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d")
+        start = _to_date(start_date)
+        end = _to_date(end_date)
         num_days = (end - start).days + 1
         
         # Generate day plans
@@ -86,6 +107,7 @@ class ItineraryAgent:
             if attractions_list 
             else DEFAULT_ATTRACTIONS_PER_DAY
         )
+        explore = f"Explore {destination}"
         
         for i in range(num_days):
             current_date = start + timedelta(days=i)
@@ -95,44 +117,27 @@ class ItineraryAgent:
             end_idx = start_idx + attractions_per_day
             day_attractions = attractions_list[start_idx:end_idx] if attractions_list else []
             
-            activities = []
+            # Attractions every three hours from 10:00, or free exploration
+            # when the day has none
+            if day_attractions:
+                day_activities = [
+                    {
+                        "time": f"{10 + 3 * j:02d}:00",
+                        "type": "attraction",
+                        "description": f"Visit {getattr(attraction, 'name', str(attraction))}"
+                    }
+                    for j, attraction in enumerate(day_attractions)
+                ]
+            else:
+                day_activities = [
+                    {"time": "10:00", "type": "exploration", "description": explore}
+                ]
             
-            # Morning activity
-            activities.append({
-                "time": "09:00",
-                "type": "breakfast",
-                "description": "Breakfast at hotel"
-            })
-            
-            # Add attractions as activities
-            hour = 10
-            for attraction in day_attractions:
-                attraction_name = getattr(attraction, 'name', str(attraction))
-                activities.append({
-                    "time": f"{hour:02d}:00",
-                    "type": "attraction",
-                    "description": f"Visit {attraction_name}"
-                })
-                hour += 3
-            
-            # Add default activities if no attractions
-            if not day_attractions:
-                activities.append({
-                    "time": "10:00",
-                    "type": "exploration",
-                    "description": f"Explore {destination}"
-                })
-            
-            # Evening activity
-            activities.append({
-                "time": "19:00",
-                "type": "dinner",
-                "description": "Dinner at local restaurant"
-            })
+            activities = [dict(_BREAKFAST), *day_activities, dict(_DINNER)]
             
             day_plan = DayPlan(
                 day_number=i + 1,
-                date=current_date.strftime("%Y-%m-%d"),
+                date=current_date.isoformat(),
                 activities=activities,
                 notes=f"Day {i + 1} in {destination}"
             )
@@ -140,8 +145,8 @@ class ItineraryAgent:
         
         itinerary = Itinerary(
             destination=destination,
-            start_date=start_date,
-            end_date=end_date,
+            start_date=start.isoformat(),
+            end_date=end.isoformat(),
             days=days,
             summary=f"{num_days}-day trip to {destination}"
         )
@@ -183,11 +188,14 @@ class ItineraryAgent:
             Updated Itinerary object
         """
         if 1 <= day_number <= len(itinerary.days):
-            itinerary.days[day_number - 1].activities.append(activity)
-            # Sort by time
-            itinerary.days[day_number - 1].activities.sort(
-                key=lambda x: x.get("time", "00:00")
-            )
+            activities = itinerary.days[day_number - 1].activities
+            # "HH:MM" strings order correctly as text. Days not yet in time
+            # order (e.g. built by the caller, or with attractions past
+            # dinner) are sorted once first; insort then places the new
+            # activity after any at the same time, like append + stable sort
+            if any(_activity_time(a) > _activity_time(b) for a, b in pairwise(activities)):
+                activities.sort(key=_activity_time)
+            insort(activities, activity, key=_activity_time)
         return itinerary
     
     def get_daily_summary(
@@ -215,5 +223,5 @@ class ItineraryAgent:
         return {
             "agent": "ItineraryAgent",
             "status": "active",
-            "initialized_at": self.initialized_at.isoformat()
+            "initialized_at": self._init_iso
         }
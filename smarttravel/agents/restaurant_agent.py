@@ -4,15 +4,20 @@ Specialized agent for discovering and recommending restaurants based on
 cuisine preferences, dietary restrictions, and budget constraints.
 """
 
+import heapq
 import logging
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+import math
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
+from copy import copy
+from dataclasses import dataclass, replace
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Restaurant:
     """Data class for restaurants"""
     name: str
@@ -22,12 +27,214 @@ class Restaurant:
     rating: float
     price_range: str  # "$", "$$", "$$$", "$$$$"
     average_cost_per_person: float
-    dietary_options: List[str]  # ["vegetarian", "vegan", "gluten-free", etc.]
+    dietary_options: Tuple[str, ...]  # ("vegetarian", "vegan", "gluten-free", etc.)
     open_hours: str = "11:00-22:00"
     reservations_required: bool = False
     distance_km: float = 0.0
 
 
+# Mock catalog - in production, this would come from restaurant APIs
+# (e.g., Yelp, Google Places, TripAdvisor). Filters only look at
+# destination-independent fields, so they run on these templates; the
+# "{destination}" placeholders are filled in per destination by _catalog_for.
+_RESTAURANT_TEMPLATES: Tuple[Restaurant, ...] = (
+    Restaurant(
+        name="La Bella {destination}",
+        cuisine="italian",
+        location="Downtown, {destination}",
+        description="Authentic Italian cuisine with fresh pasta and wood-fired pizzas",
+        rating=4.6,
+        price_range="$$",
+        average_cost_per_person=35.0,
+        dietary_options=("vegetarian", "gluten-free"),
+        reservations_required=True,
+        distance_km=1.2
+    ),
+    Restaurant(
+        name="{destination} Sushi Bar",
+        cuisine="japanese",
+        location="Financial District, {destination}",
+        description="Modern Japanese restaurant with sushi bar and omakase menu",
+        rating=4.8,
+        price_range="$$$",
+        average_cost_per_person=65.0,
+        dietary_options=("gluten-free",),
+        reservations_required=True,
+        distance_km=0.8
+    ),
+    Restaurant(
+        name="Spice of {destination}",
+        cuisine="indian",
+        location="Cultural Quarter, {destination}",
+        description="Traditional Indian restaurant with regional specialties",
+        rating=4.5,
+        price_range="$$",
+        average_cost_per_person=30.0,
+        dietary_options=("vegetarian", "vegan", "gluten-free"),
+        reservations_required=False,
+        distance_km=2.1
+    ),
+    Restaurant(
+        name="Green Garden Bistro",
+        cuisine="vegetarian",
+        location="Arts District, {destination}",
+        description="Plant-based restaurant with creative vegetarian dishes",
+        rating=4.7,
+        price_range="$$",
+        average_cost_per_person=28.0,
+        dietary_options=("vegetarian", "vegan", "gluten-free"),
+        reservations_required=False,
+        distance_km=1.5
+    ),
+    Restaurant(
+        name="{destination} Street Food Market",
+        cuisine="international",
+        location="Market Square, {destination}",
+        description="Vibrant food market with diverse international cuisines",
+        rating=4.4,
+        price_range="$",
+        average_cost_per_person=15.0,
+        dietary_options=("vegetarian", "vegan", "halal"),
+        reservations_required=False,
+        distance_km=0.5
+    ),
+    Restaurant(
+        name="Le Gourmet {destination}",
+        cuisine="french",
+        location="Historic Center, {destination}",
+        description="Fine dining French restaurant with Michelin-star experience",
+        rating=4.9,
+        price_range="$$$$",
+        average_cost_per_person=120.0,
+        dietary_options=("vegetarian",),
+        reservations_required=True,
+        distance_km=1.8
+    ),
+    Restaurant(
+        name="Taco Fiesta",
+        cuisine="mexican",
+        location="Beach District, {destination}",
+        description="Casual Mexican eatery with authentic tacos and margaritas",
+        rating=4.3,
+        price_range="$",
+        average_cost_per_person=20.0,
+        dietary_options=("vegetarian", "vegan", "gluten-free"),
+        reservations_required=False,
+        distance_km=3.2
+    ),
+    Restaurant(
+        name="{destination} BBQ House",
+        cuisine="american",
+        location="Riverside, {destination}",
+        description="American steakhouse with premium cuts and craft cocktails",
+        rating=4.5,
+        price_range="$$$",
+        average_cost_per_person=70.0,
+        dietary_options=("gluten-free",),
+        reservations_required=True,
+        distance_km=2.5
+    )
+)
+
+
+# Hashed dietary options of each template, for filtering; kept off Restaurant
+# so they stay out of its repr/eq/asdict
+_TEMPLATE_DIETARY_SETS: Tuple[FrozenSet[str], ...] = tuple(
+    frozenset(r.dietary_options) for r in _RESTAURANT_TEMPLATES
+)
+
+
+def _build_restaurant(template: Restaurant, destination: str) -> Restaurant:
+    """Instantiate a catalog template for a destination"""
+    return replace(
+        template,
+        name=template.name.format(destination=destination),
+        location=template.location.format(destination=destination)
+    )
+
+
+@lru_cache(maxsize=64)
+def _catalog_for(destination: str) -> Tuple[Restaurant, ...]:
+    """Full catalog with the destination filled in, built once per destination
+    
+    Entries line up with _RESTAURANT_TEMPLATES. They are shared, so hand
+    out copies (see _restaurants_at).
+    """
+    return tuple(_build_restaurant(t, destination) for t in _RESTAURANT_TEMPLATES)
+
+
+def _restaurants_at(destination: str, indices: Tuple[int, ...]) -> List[Restaurant]:
+    """Fresh Restaurant objects for catalog positions in a destination"""
+    catalog = _catalog_for(destination)
+    return [copy(catalog[i]) for i in indices]
+
+
+@lru_cache(maxsize=128)
+def _matching_indices(
+    cuisine_set: Optional[FrozenSet[str]],
+    dietary_set: Optional[FrozenSet[str]],
+    price_range: Optional[str]
+) -> Tuple[int, ...]:
+    """Catalog positions passing all filters, in catalog order
+    
+    The catalog is static, so the match list depends only on the filter
+    settings and is computed once per combination.
+    """
+    return tuple(
+        i for i, (r, diets) in enumerate(zip(_RESTAURANT_TEMPLATES, _TEMPLATE_DIETARY_SETS))
+        if (cuisine_set is None or r.cuisine in cuisine_set)
+        and (price_range is None or r.price_range == price_range)
+        and (dietary_set is None or not diets.isdisjoint(dietary_set))
+    )
+
+
+# Cuisines searched for breakfast when the user has no cuisine preference
+_BREAKFAST_CUISINES = ("american", "french")
+
+_RATING = attrgetter("rating")
+_COST_PER_PERSON = attrgetter("average_cost_per_person")
+
+
+def _template_rating(index: int) -> float:
+    """Rating of the catalog restaurant at a position"""
+    return _RESTAURANT_TEMPLATES[index].rating
+
+
+# Preference key: (cuisines, dietary restrictions, price range), each None
+# when that filter is not applied
+_PreferenceKey = Tuple[Optional[Tuple[str, ...]], Optional[Tuple[str, ...]], Optional[str]]
+
+
+def _preference_key(meal_type: str, preferences: Dict[str, Any]) -> _PreferenceKey:
+    """Build a hashable, order-independent key for a meal search"""
+    if meal_type == "breakfast":
+        cuisines = preferences.get("cuisines", _BREAKFAST_CUISINES)
+    else:  # lunch, dinner
+        cuisines = preferences.get("cuisines", None)
+    dietary = preferences.get("dietary_restrictions")
+    return (
+        tuple(sorted(set(cuisines))) if cuisines else None,
+        tuple(sorted(set(dietary))) if dietary else None,
+        preferences.get("price_range") or None
+    )
+
+
+@lru_cache(maxsize=128)
+def _recommend_cached(pref_key: _PreferenceKey, count: int = 3) -> Tuple[int, ...]:
+    """Catalog positions of the top-rated matches for a preference key
+    
+    The catalog filters don't depend on the destination, so results are
+    shared across destinations and days.
+    """
+    cuisines, dietary, price_range = pref_key
+    matches = _matching_indices(
+        frozenset(cuisines) if cuisines else None,
+        frozenset(dietary) if dietary else None,
+        price_range
+    )
+    return tuple(heapq.nlargest(count, matches[:10], key=_template_rating))
+
+
 class RestaurantAgent:
     """Agent specialized in restaurant discovery and dining recommendations
     
@@ -43,6 +250,7 @@ class RestaurantAgent:
         """
         self.config = config
         self.initialized_at = datetime.now()
+        self._init_iso = self.initialized_at.isoformat()
         logger.info("RestaurantAgent initialized")
     
     def discover_restaurants(
@@ -67,129 +275,15 @@ class RestaurantAgent:
         """
         logger.info(f"Discovering restaurants in {destination}")
         
-        # Mock implementation - in production, this would call restaurant APIs
-        # (e.g., Yelp, Google Places, TripAdvisor)
-        all_restaurants = [
-            Restaurant(
-                name=f"La Bella {destination}",
-                cuisine="italian",
-                location=f"Downtown, {destination}",
-                description="Authentic Italian cuisine with fresh pasta and wood-fired pizzas",
-                rating=4.6,
-                price_range="$$",
-                average_cost_per_person=35.0,
-                dietary_options=["vegetarian", "gluten-free"],
-                reservations_required=True,
-                distance_km=1.2
-            ),
-            Restaurant(
-                name=f"{destination} Sushi Bar",
-                cuisine="japanese",
-                location=f"Financial District, {destination}",
-                description="Modern Japanese restaurant with sushi bar and omakase menu",
-                rating=4.8,
-                price_range="$$$",
-                average_cost_per_person=65.0,
-                dietary_options=["gluten-free"],
-                reservations_required=True,
-                distance_km=0.8
-            ),
-            Restaurant(
-                name=f"Spice of {destination}",
-                cuisine="indian",
-                location=f"Cultural Quarter, {destination}",
-                description="Traditional Indian restaurant with regional specialties",
-                rating=4.5,
-                price_range="$$",
-                average_cost_per_person=30.0,
-                dietary_options=["vegetarian", "vegan", "gluten-free"],
-                reservations_required=False,
-                distance_km=2.1
-            ),
-            Restaurant(
-                name=f"Green Garden Bistro",
-                cuisine="vegetarian",
-                location=f"Arts District, {destination}",
-                description="Plant-based restaurant with creative vegetarian dishes",
-                rating=4.7,
-                price_range="$$",
-                average_cost_per_person=28.0,
-                dietary_options=["vegetarian", "vegan", "gluten-free"],
-                reservations_required=False,
-                distance_km=1.5
-            ),
-            Restaurant(
-                name=f"{destination} Street Food Market",
-                cuisine="international",
-                location=f"Market Square, {destination}",
-                description="Vibrant food market with diverse international cuisines",
-                rating=4.4,
-                price_range="$",
-                average_cost_per_person=15.0,
-                dietary_options=["vegetarian", "vegan", "halal"],
-                reservations_required=False,
-                distance_km=0.5
-            ),
-            Restaurant(
-                name=f"Le Gourmet {destination}",
-                cuisine="french",
-                location=f"Historic Center, {destination}",
-                description="Fine dining French restaurant with Michelin-star experience",
-                rating=4.9,
-                price_range="$$$$",
-                average_cost_per_person=120.0,
-                dietary_options=["vegetarian"],
-                reservations_required=True,
-                distance_km=1.8
-            ),
-            Restaurant(
-                name=f"Taco Fiesta",
-                cuisine="mexican",
-                location=f"Beach District, {destination}",
-                description="Casual Mexican eatery with authentic tacos and margaritas",
-                rating=4.3,
-                price_range="$",
-                average_cost_per_person=20.0,
-                dietary_options=["vegetarian", "vegan", "gluten-free"],
-                reservations_required=False,
-                distance_km=3.2
-            ),
-            Restaurant(
-                name=f"{destination} BBQ House",
-                cuisine="american",
-                location=f"Riverside, {destination}",
-                description="American steakhouse with premium cuts and craft cocktails",
-                rating=4.5,
-                price_range="$$$",
-                average_cost_per_person=70.0,
-                dietary_options=["gluten-free"],
-                reservations_required=True,
-                distance_km=2.5
-            )
-        ]
-        
-        # Filter by cuisine if specified
-        if cuisines:
-            all_restaurants = [
-                r for r in all_restaurants 
-                if r.cuisine in cuisines
-            ]
+        # Mock implementation - filters run over the shared catalog templates.
+        # Empty filters mean "no filter", matching the previous truthiness checks.
+        cuisine_set = frozenset(cuisines) if cuisines else None
+        dietary_set = frozenset(dietary_restrictions) if dietary_restrictions else None
+        price_range = price_range or None
         
-        # Filter by dietary restrictions if specified
-        if dietary_restrictions:
-            all_restaurants = [
-                r for r in all_restaurants
-                if any(diet in r.dietary_options for diet in dietary_restrictions)
-            ]
+        matches = _matching_indices(cuisine_set, dietary_set, price_range)
         
-        # Filter by price range if specified
-        if price_range:
-            all_restaurants = [
-                r for r in all_restaurants
-                if r.price_range == price_range
-            ]
-        
-        return all_restaurants[:max_results]
+        return _restaurants_at(destination, matches[:max(max_results, 0)])
     
     def get_top_restaurants(
         self,
@@ -205,12 +299,8 @@ class RestaurantAgent:
         Returns:
             List of top-rated Restaurant objects
         """
-        sorted_restaurants = sorted(
-            restaurants, 
-            key=lambda r: r.rating, 
-            reverse=True
-        )
-        return sorted_restaurants[:count]
+        # Equivalent to sorted(..., reverse=True)[:count], ties included
+        return heapq.nlargest(count, restaurants, key=_RATING)
     
     def get_budget_friendly_options(
         self,
@@ -264,7 +354,7 @@ class RestaurantAgent:
         Returns:
             Total estimated cost
         """
-        return sum(r.average_cost_per_person * num_people for r in restaurants)
+        return math.fsum(map(_COST_PER_PERSON, restaurants)) * num_people
     
     def get_recommendations_by_meal_type(
         self,
@@ -282,24 +372,9 @@ class RestaurantAgent:
         Returns:
             List of recommended restaurants
         """
-        preferences = preferences or {}
-        
-        # Adjust search based on meal type
-        if meal_type == "breakfast":
-            cuisines = preferences.get("cuisines", ["american", "french"])
-        elif meal_type == "lunch":
-            cuisines = preferences.get("cuisines", None)
-        else:  # dinner
-            cuisines = preferences.get("cuisines", None)
-        
-        restaurants = self.discover_restaurants(
-            destination=destination,
-            cuisines=cuisines,
-            dietary_restrictions=preferences.get("dietary_restrictions"),
-            price_range=preferences.get("price_range")
-        )
-        
-        return self.get_top_restaurants(restaurants, count=3)
+        # Cuisine defaults depend on the meal type (see _preference_key)
+        pref_key = _preference_key(meal_type, preferences or {})
+        return _restaurants_at(destination, _recommend_cached(pref_key))
     
     def create_dining_itinerary(
         self,
@@ -317,20 +392,22 @@ class RestaurantAgent:
         Returns:
             Dictionary with day-wise restaurant recommendations
         """
-        itinerary = {}
+        preferences = preferences or {}
         meal_types = ["breakfast", "lunch", "dinner"]
         
+        # The pick per meal is the same every day; look it up once per meal
+        # type and build fresh objects for each day
+        picks = {
+            meal_type: _recommend_cached(_preference_key(meal_type, preferences))[:1]
+            for meal_type in meal_types
+        }
+        
+        itinerary = {}
         for day in range(1, num_days + 1):
-            day_key = f"Day {day}"
-            itinerary[day_key] = {}
-            
-            for meal_type in meal_types:
-                recommendations = self.get_recommendations_by_meal_type(
-                    destination=destination,
-                    meal_type=meal_type,
-                    preferences=preferences
-                )
-                itinerary[day_key][meal_type] = recommendations[:1]  # One per meal
+            itinerary[f"Day {day}"] = {
+                meal_type: _restaurants_at(destination, picks[meal_type])  # One per meal
+                for meal_type in meal_types
+            }
         
         return itinerary
     
@@ -339,5 +416,5 @@ class RestaurantAgent:
         return {
             "agent": "RestaurantAgent",
             "status": "active",
-            "initialized_at": self.initialized_at.isoformat()
+            "initialized_at": self._init_iso
         }
@@ -4,14 +4,16 @@ Specialized agent for fetching weather data and providing travel weather insight
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union, overload
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class WeatherForecast:
     """Data class for weather forecasts"""
     date: str
@@ -25,6 +27,130 @@ class WeatherForecast:
     description: str
 
 
+# Per-day array fields of WeatherForecastBatch, compared with np.array_equal
+_BATCH_COLUMNS = ("dates", "temp_high", "temp_low", "condition", "precip", "humidity", "wind")
+
+
+@dataclass(slots=True, eq=False)
+class WeatherForecastBatch:
+    """Column-oriented weather forecast for one location
+    
+    Each field holds one value per day. Indexing or iterating materializes
+    WeatherForecast objects (slicing gives a list of them), and a batch
+    compares equal to the equivalent list, so it can be used wherever a
+    list of forecasts was expected.
+    """
+    location: str
+    dates: np.ndarray
+    temp_high: np.ndarray
+    temp_low: np.ndarray
+    condition: np.ndarray
+    precip: np.ndarray
+    humidity: np.ndarray
+    wind: np.ndarray
+    descriptions: Optional[np.ndarray] = None  # None: default text per day
+    
+    __hash__ = None  # type: ignore[assignment]  # mutable, like a list
+    
+    def __len__(self) -> int:
+        return len(self.dates)
+    
+    def __eq__(self, other: object) -> bool:
+        """Compare column by column, or day by day against a list of forecasts"""
+        if isinstance(other, list):
+            return list(self) == other
+        if not isinstance(other, WeatherForecastBatch):
+            return NotImplemented
+        return (
+            self.location == other.location
+            and all(
+                np.array_equal(getattr(self, name), getattr(other, name))
+                for name in _BATCH_COLUMNS
+            )
+            and self._description_list() == other._description_list()
+        )
+    
+    def _description_list(self) -> List[str]:
+        return [self._description(i) for i in range(len(self))]
+    
+    def _description(self, index: int) -> str:
+        if self.descriptions is not None:
+            return str(self.descriptions[index])
+        return f"Pleasant weather expected in {self.location}"
+    
+    @overload
+    def __getitem__(self, index: int) -> WeatherForecast: ...
+    
+    @overload
+    def __getitem__(self, index: slice) -> List[WeatherForecast]: ...
+    
+    def __getitem__(
+        self,
+        index: Union[int, slice]
+    ) -> Union[WeatherForecast, List[WeatherForecast]]:
+        """Materialize a day as a WeatherForecast, or a slice as a list of them"""
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        
+        return WeatherForecast(
+            date=str(self.dates[index]),
+            location=self.location,
+            temperature_high=self.temp_high.item(index),
+            temperature_low=self.temp_low.item(index),
+            condition=str(self.condition[index]),
+            precipitation_chance=self.precip.item(index),
+            humidity=self.humidity.item(index),
+            wind_speed=self.wind.item(index),
+            description=self._description(index)
+        )
+    
+    def __iter__(self) -> Iterator[WeatherForecast]:
+        return (self[i] for i in range(len(self)))
+
+
+Forecasts = Union[List[WeatherForecast], WeatherForecastBatch]
+
+
+# Advice given on days above 32°C
+_HOT_ADVICE = (
+    "Stay hydrated and avoid midday sun",
+    "Plan outdoor activities for morning/evening",
+)
+
+
+def _as_batch(forecasts: Forecasts) -> WeatherForecastBatch:
+    """Return forecasts as a WeatherForecastBatch, converting lists column by column"""
+    if isinstance(forecasts, WeatherForecastBatch):
+        return forecasts
+    
+    count = len(forecasts)
+    
+    def column(attr: str) -> np.ndarray:
+        return np.fromiter(
+            (getattr(f, attr) for f in forecasts), dtype=np.float64, count=count
+        )
+    
+    return WeatherForecastBatch(
+        location=forecasts[0].location if forecasts else "",
+        dates=np.array([f.date for f in forecasts], dtype=str),
+        temp_high=column("temperature_high"),
+        temp_low=column("temperature_low"),
+        condition=np.array([f.condition for f in forecasts], dtype=str),
+        precip=column("precipitation_chance"),
+        humidity=column("humidity"),
+        wind=column("wind_speed"),
+        descriptions=np.array([f.description for f in forecasts], dtype=str)
+    )
+
+
+def _to_columns(
+    forecasts: Forecasts
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split forecasts into high temperature, low temperature and precipitation arrays"""
+    batch = _as_batch(forecasts)
+    return batch.temp_high, batch.temp_low, batch.precip
+
+
 class WeatherAgent:
     """Agent specialized in weather forecasts and climate recommendations
     
@@ -40,6 +166,7 @@ class WeatherAgent:
         """
         self.config = config
         self.initialized_at = datetime.now()
+        self._init_iso = self.initialized_at.isoformat()
         logger.info("WeatherAgent initialized")
     
     def get_forecast(
@@ -47,7 +174,7 @@ class WeatherAgent:
         destination: str,
         start_date: str,
         end_date: str
-    ) -> List[WeatherForecast]:
+    ) -> WeatherForecastBatch:
         """Get weather forecast for a destination and date range
         
         Args:
@@ -56,42 +183,36 @@ class WeatherAgent:
             end_date: End date in YYYY-MM-DD format
         
         Returns:
-            List of WeatherForecast objects
+            WeatherForecastBatch with one row per day
         """
         logger.info(f"Fetching weather forecast for {destination}")
         
         # Mock implementation - in production, this would call weather APIs
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d")
-        days = (end - start).days + 1
-        
-        forecasts = []
-        for i in range(days):
-            forecast_date = start + timedelta(days=i)
-            forecasts.append(
-                WeatherForecast(
-                    date=forecast_date.strftime("%Y-%m-%d"),
-                    location=destination,
-                    temperature_high=25.0 + (i % 5),
-                    temperature_low=18.0 + (i % 3),
-                    condition="sunny" if i % 2 == 0 else "partly cloudy",
-                    precipitation_chance=20.0 + (i * 5),
-                    humidity=60.0 + (i % 10),
-                    wind_speed=15.0 + (i % 8),
-                    description=f"Pleasant weather expected in {destination}"
-                )
-            )
+        start = np.datetime64(start_date, "D")
+        end = np.datetime64(end_date, "D")
+        days = max(int((end - start) // np.timedelta64(1, "D")) + 1, 0)
+        offsets = np.arange(days)
+        idx = offsets.astype(np.float64)
         
-        return forecasts
+        return WeatherForecastBatch(
+            location=destination,
+            dates=(start + offsets).astype(str),
+            temp_high=25.0 + (idx % 5),
+            temp_low=18.0 + (idx % 3),
+            condition=np.where(idx % 2 == 0, "sunny", "partly cloudy"),
+            precip=20.0 + idx * 5,
+            humidity=60.0 + (idx % 10),
+            wind=15.0 + (idx % 8)
+        )
     
     def get_weather_summary(
         self,
-        forecasts: List[WeatherForecast]
+        forecasts: Forecasts
     ) -> Dict[str, Any]:
         """Generate weather summary for a trip
         
         Args:
-            forecasts: List of weather forecasts
+            forecasts: Weather forecasts, as a list or WeatherForecastBatch
         
         Returns:
             Dictionary with weather summary statistics
@@ -99,54 +220,49 @@ class WeatherAgent:
         if not forecasts:
             return {}
         
-        avg_high = sum(f.temperature_high for f in forecasts) / len(forecasts)
-        avg_low = sum(f.temperature_low for f in forecasts) / len(forecasts)
-        max_precip = max(f.precipitation_chance for f in forecasts)
-        rainy_days = len([f for f in forecasts if f.precipitation_chance > 50])
+        highs, lows, precip = _to_columns(forecasts)
         
         return {
-            "average_high": round(avg_high, 1),
-            "average_low": round(avg_low, 1),
-            "max_precipitation_chance": round(max_precip, 1),
-            "rainy_days": rainy_days,
+            "average_high": round(float(highs.mean()), 1),
+            "average_low": round(float(lows.mean()), 1),
+            "max_precipitation_chance": round(float(precip.max()), 1),
+            "rainy_days": int((precip > 50).sum()),
             "total_days": len(forecasts)
         }
     
     def get_weather_warnings(
         self,
-        forecasts: List[WeatherForecast]
+        forecasts: Forecasts
     ) -> List[str]:
         """Identify weather warnings and alerts
         
         Args:
-            forecasts: List of weather forecasts
+            forecasts: Weather forecasts, as a list or WeatherForecastBatch
         
         Returns:
             List of warning messages
         """
-        warnings = []
-        
-        for forecast in forecasts:
-            if forecast.precipitation_chance > 70:
-                warnings.append(
-                    f"High chance of rain on {forecast.date} ({forecast.precipitation_chance}%)"
-                )
-            
-            if forecast.temperature_high > 35:
-                warnings.append(
-                    f"Extreme heat expected on {forecast.date} ({forecast.temperature_high}°C)"
-                )
-            
-            if forecast.temperature_low < 5:
-                warnings.append(
-                    f"Cold weather on {forecast.date} ({forecast.temperature_low}°C)"
-                )
-            
-            if forecast.wind_speed > 40:
-                warnings.append(
-                    f"Strong winds on {forecast.date} ({forecast.wind_speed} km/h)"
-                )
+        batch = _as_batch(forecasts)
+        checks = (
+            ("precipitation_chance", batch.precip > 70, "High chance of rain on {} ({}%)"),
+            ("temperature_high", batch.temp_high > 35, "Extreme heat expected on {} ({}°C)"),
+            ("temperature_low", batch.temp_low < 5, "Cold weather on {} ({}°C)"),
+            ("wind_speed", batch.wind > 40, "Strong winds on {} ({} km/h)"),
+        )
         
+        # Only the flagged days are formatted, from the caller's own forecast
+        # values so ints are not shown as floats; sorting by (day, check)
+        # keeps the day-by-day ordering of the original per-forecast loop
+        hits = sorted(
+            (day, rule)
+            for rule, (_, mask, _) in enumerate(checks)
+            for day in np.flatnonzero(mask).tolist()
+        )
+        warnings = []
+        for day, rule in hits:
+            attr, _, message = checks[rule]
+            forecast = forecasts[day]
+            warnings.append(message.format(forecast.date, getattr(forecast, attr)))
         return warnings
     
     def suggest_activity_adjustments(
@@ -173,8 +289,7 @@ class WeatherAgent:
             suggestions["advice"].append("Consider indoor activities like museums")
         
         if forecast.temperature_high > 32:
-            suggestions["advice"].append("Stay hydrated and avoid midday sun")
-            suggestions["advice"].append("Plan outdoor activities for morning/evening")
+            suggestions["advice"].extend(_HOT_ADVICE)
         
         if forecast.temperature_low < 10:
             suggestions["advice"].append("Bring warm clothing for cooler temperatures")
@@ -184,10 +299,47 @@ class WeatherAgent:
         
         return suggestions
     
+    def suggest_activity_adjustments_batch(
+        self,
+        forecasts: Forecasts
+    ) -> List[Dict[str, Any]]:
+        """Suggest activity adjustments for every day of a forecast
+        
+        Same rules as suggest_activity_adjustments, with the thresholds
+        evaluated once per column rather than once per day.
+        
+        Args:
+            forecasts: Weather forecasts, as a list or WeatherForecastBatch
+        
+        Returns:
+            List of suggestion dictionaries, one per day
+        """
+        batch = _as_batch(forecasts)
+        wet = (batch.precip > 60).tolist()
+        hot = (batch.temp_high > 32).tolist()
+        cold = (batch.temp_low < 10).tolist()
+        
+        suggestions = []
+        for is_wet, is_hot, is_cold in zip(wet, hot, cold):
+            advice = []
+            if is_wet:
+                advice.append("Consider indoor activities like museums")
+            if is_hot:
+                advice.extend(_HOT_ADVICE)
+            if is_cold:
+                advice.append("Bring warm clothing for cooler temperatures")
+            suggestions.append({
+                "outdoor_suitable": not is_wet,
+                "indoor_recommended": is_wet,
+                "advice": advice or ["Great day for outdoor exploration!"]
+            })
+        
+        return suggestions
+    
     def get_status(self) -> Dict[str, Any]:
         """Get current agent status"""
         return {
             "agent": "WeatherAgent",
             "status": "active",
-            "initialized_at": self.initialized_at.isoformat()
+            "initialized_at": self._init_iso
         }
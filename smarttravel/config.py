@@ -1,31 +1,74 @@
 """Configuration settings for SmartTravel AI"""
 
 import os
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 
+# Environment read once at import; Config defaults below refer to these
+_ENV = os.environ
+_TRUE_VALUES = ("1", "true", "yes")
+_GEMINI_API_KEY = _ENV.get("GEMINI_API_KEY", "")
+_SKYSCANNER_API_KEY = _ENV.get("SKYSCANNER_API_KEY", "")
+_BOOKING_COM_API_KEY = _ENV.get("BOOKING_COM_API_KEY", "")
+_GOOGLE_MAPS_API_KEY = _ENV.get("GOOGLE_MAPS_API_KEY", "")
+_EAGER_AGENT_INIT = _ENV.get("EAGER_AGENT_INIT", "").lower() in _TRUE_VALUES
 
-@dataclass
+# System settings, importable directly (e.g. `from smarttravel.config import DEBUG`).
+# TIMEOUT and MAX_RETRIES are parsed when the config is built; see __getattr__ below.
+DEBUG: bool = _ENV.get("DEBUG", "").lower() in _TRUE_VALUES
+
+
+def _int_env(name: str, default: int) -> int:
+    """Read an integer setting from the environment
+    
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset or empty
+        
+    Returns:
+        The parsed integer
+        
+    Raises:
+        ValueError: If the variable is set but is not an integer
+    """
+    value = _ENV.get(name, "").strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} environment variable must be an integer, got {value!r}") from None
+
+
+@dataclass(slots=True, frozen=True, repr=False)
 class Config:
     """Main configuration class for SmartTravel AI"""
     
     # API Configuration
-    gemini_api_key: str = os.getenv("GEMINI_API_KEY", "")
+    gemini_api_key: str = _GEMINI_API_KEY
     
     # Agent Configuration
     model_name: str = "gemini-1.5-pro"
     temperature: float = 0.7
     top_p: float = 0.95
     
-    # Travel Services API Keys (optional)
-    skyscanner_api_key: Optional[str] = os.getenv("SKYSCANNER_API_KEY")
-    booking_com_api_key: Optional[str] = os.getenv("BOOKING_COM_API_KEY")
-    google_maps_api_key: Optional[str] = os.getenv("GOOGLE_MAPS_API_KEY")
+    # Travel Services API Keys (optional, empty when not configured)
+    skyscanner_api_key: str = _SKYSCANNER_API_KEY
+    booking_com_api_key: str = _BOOKING_COM_API_KEY
+    google_maps_api_key: str = _GOOGLE_MAPS_API_KEY
     
     # System Configuration
-    max_retries: int = 3
-    timeout: int = 30
-    debug_mode: bool = os.getenv("DEBUG", "False").lower() == "true"
+    max_retries: int = field(default_factory=partial(_int_env, "MAX_RETRIES", 3))
+    timeout: int = field(default_factory=partial(_int_env, "TIMEOUT", 30))
+    debug_mode: bool = DEBUG
+    eager_init: bool = _EAGER_AGENT_INIT
+    
+    def __repr__(self) -> str:
+        # API keys are left out so the config can be logged safely
+        return (
+            f"Config(model_name={self.model_name!r}, debug_mode={self.debug_mode}, "
+            f"eager_init={self.eager_init})"
+        )
     
     def validate(self) -> bool:
         """Validate configuration settings"""
@@ -34,5 +77,19 @@ class Config:
         return True
 
 
-# Default configuration instance
-config = Config()
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the shared default configuration"""
+    return Config()
+
+
+def __getattr__(name: str):
+    # Built on first access so a malformed environment variable surfaces from
+    # get_config() rather than breaking `import smarttravel`
+    if name == "config":
+        return get_config()
+    if name == "TIMEOUT":
+        return get_config().timeout
+    if name == "MAX_RETRIES":
+        return get_config().max_retries
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,63 +1,161 @@
 """Tests for SmartTravel AI agents"""
 
+import asyncio
 import pytest
+from dataclasses import asdict
 from datetime import datetime
 
 from smarttravel.agents.flight_agent import FlightAgent, FlightOption
 from smarttravel.agents.hotel_agent import HotelAgent, HotelOption
 from smarttravel.agents.attraction_agent import AttractionAgent, Attraction
-from smarttravel.agents.itinerary_agent import ItineraryAgent
-from smarttravel.agents.concierge import TravelConcierge, TravelRequest
+from smarttravel.agents.itinerary_agent import DayPlan, Itinerary, ItineraryAgent
+from smarttravel.agents.concierge import (
+    TravelConcierge,
+    TravelRequest,
+    _shared_agent,
+    shutdown_search_executor,
+)
+from smarttravel.agents.budget_optimizer_agent import (
+    BudgetBreakdown,
+    BudgetOptimizerAgent,
+    BudgetTier,
+    PriorityCategory,
+)
+from smarttravel.agents.currency_converter_agent import CurrencyConverterAgent
+from smarttravel.agents.disruption_agent import (
+    Disruption,
+    DisruptionAgent,
+    DisruptionSeverity,
+    DisruptionType,
+)
+from smarttravel.agents.weather_agent import WeatherAgent, WeatherForecast, _as_batch
+from smarttravel.agents.restaurant_agent import RestaurantAgent
+from smarttravel.config import Config, get_config
+
+
+@pytest.fixture(scope="module")
+def flight_agent():
+    return FlightAgent()
+
+
+@pytest.fixture(scope="module")
+def flights(flight_agent):
+    return flight_agent.search_flights("NYC", "Paris", "2024-06-01")
+
+
+@pytest.fixture(scope="module")
+def hotel_agent():
+    return HotelAgent()
+
+
+@pytest.fixture(scope="module")
+def attraction_agent():
+    return AttractionAgent()
+
+
+@pytest.fixture(scope="module")
+def itinerary_agent():
+    return ItineraryAgent()
+
+
+@pytest.fixture(scope="module")
+def budget_agent():
+    return BudgetOptimizerAgent()
+
+
+@pytest.fixture(scope="module")
+def currency_agent():
+    return CurrencyConverterAgent()
+
+
+@pytest.fixture(scope="module")
+def disruption_agent():
+    return DisruptionAgent()
+
+
+@pytest.fixture(scope="module")
+def weather_agent():
+    return WeatherAgent()
+
+
+@pytest.fixture(scope="module")
+def restaurant_agent():
+    return RestaurantAgent()
+
+
+@pytest.fixture(scope="module")
+def concierge():
+    return TravelConcierge()
+
+
+@pytest.fixture(scope="module")
+def paris_request():
+    return TravelRequest(
+        destination="Paris",
+        start_date="2024-06-01",
+        end_date="2024-06-07",
+        origin="NYC",
+        travelers=2
+    )
+
+
+@pytest.fixture(scope="module")
+def processed_result(concierge, paris_request):
+    return concierge.process_request(paris_request)
 
 
 class TestFlightAgent:
     """Tests for FlightAgent"""
     
-    def test_init(self):
+    def test_init(self, flight_agent):
         """Test FlightAgent initialization"""
-        agent = FlightAgent()
-        assert agent.initialized_at is not None
+        assert flight_agent.initialized_at is not None
     
-    def test_search_flights(self):
+    def test_search_flights(self, flights):
         """Test flight search functionality"""
-        agent = FlightAgent()
-        flights = agent.search_flights("NYC", "Paris", "2024-06-01")
         assert len(flights) == 2
         assert all(isinstance(f, FlightOption) for f in flights)
     
-    def test_get_best_flight_by_price(self):
-        """Test getting best flight by price"""
-        agent = FlightAgent()
-        flights = agent.search_flights("NYC", "Paris", "2024-06-01")
-        best = agent.get_best_flight(flights, "price")
+    @pytest.mark.parametrize("preference,attribute", [
+        ("price", "price"),
+        ("duration", "duration_hours"),
+        ("stops", "stops"),
+    ])
+    def test_get_best_flight(self, flight_agent, flights, preference, attribute):
+        """Test getting best flight for each preference"""
+        best = flight_agent.get_best_flight(flights, preference)
         assert best is not None
-        assert best.price == min(f.price for f in flights)
+        assert getattr(best, attribute) == min(getattr(f, attribute) for f in flights)
+    
+    def test_get_best_flight_from_batch(self, flight_agent):
+        """Test best flight from a batch matches the list-based result"""
+        flights = flight_agent.search_flights("NYC", "Paris", "2024-06-01", passengers=2)
+        batch = flight_agent.search_flights_batch("NYC", "Paris", "2024-06-01", passengers=2)
+        assert len(batch) == len(flights)
+        for preference in ("price", "duration", "stops"):
+            assert flight_agent.get_best_flight(batch, preference) == flight_agent.get_best_flight(flights, preference)
     
-    def test_get_best_flight_empty_list(self):
+    def test_get_best_flight_empty_list(self, flight_agent):
         """Test getting best flight from empty list"""
-        agent = FlightAgent()
-        best = agent.get_best_flight([], "price")
+        best = flight_agent.get_best_flight([], "price")
         assert best is None
 
 
 class TestHotelAgent:
     """Tests for HotelAgent"""
     
-    def test_init(self):
+    def test_init(self, hotel_agent):
         """Test HotelAgent initialization"""
-        agent = HotelAgent()
-        assert agent.initialized_at is not None
+        assert hotel_agent.initialized_at is not None
     
-    def test_search_hotels(self):
+    def test_search_hotels(self, hotel_agent):
         """Test hotel search functionality"""
-        agent = HotelAgent()
-        hotels = agent.search_hotels("Paris", "2024-06-01", "2024-06-07")
+        hotels = hotel_agent.search_hotels("Paris", "2024-06-01", "2024-06-07")
         assert len(hotels) == 3
         assert all(isinstance(h, HotelOption) for h in hotels)
     
-    def test_calculate_total_cost(self):
+    def test_calculate_total_cost(self, hotel_agent):
         """Test total cost calculation"""
-        agent = HotelAgent()
         hotel = HotelOption(
             name="Test Hotel",
             location="Test Location",
@@ -65,104 +163,518 @@ class TestHotelAgent:
             price_per_night=100.0,
             amenities=["WiFi"]
         )
-        cost = agent.calculate_total_cost(hotel, nights=5, rooms=2)
+        cost = hotel_agent.calculate_total_cost(hotel, nights=5, rooms=2)
         assert cost == 1000.0
 
 
 class TestAttractionAgent:
     """Tests for AttractionAgent"""
     
-    def test_init(self):
+    def test_init(self, attraction_agent):
         """Test AttractionAgent initialization"""
-        agent = AttractionAgent()
-        assert agent.initialized_at is not None
+        assert attraction_agent.initialized_at is not None
     
-    def test_discover_attractions(self):
+    def test_discover_attractions(self, attraction_agent):
         """Test attraction discovery"""
-        agent = AttractionAgent()
-        attractions = agent.discover_attractions("Paris")
+        attractions = attraction_agent.discover_attractions("Paris")
         assert len(attractions) == 5
         assert all(isinstance(a, Attraction) for a in attractions)
     
-    def test_discover_attractions_with_filter(self):
+    def test_discover_attractions_with_filter(self, attraction_agent):
         """Test attraction discovery with category filter"""
-        agent = AttractionAgent()
-        attractions = agent.discover_attractions("Paris", categories=["museum"])
+        attractions = attraction_agent.discover_attractions("Paris", categories=["museum"])
         assert len(attractions) == 1
         assert attractions[0].category == "museum"
     
-    def test_calculate_activities_cost(self):
+    def test_discover_attractions_returns_fresh_list(self, attraction_agent):
+        """Test cached discovery results cannot be mutated by callers"""
+        first = attraction_agent.discover_attractions("Paris", categories=["park", "museum"])
+        first.clear()
+        second = attraction_agent.discover_attractions("Paris", categories=["museum", "park"])
+        assert [a.category for a in second] == ["museum", "park"]
+    
+    def test_attractions_are_hashable(self, attraction_agent):
+        """Test attractions can be used as set members"""
+        attractions = attraction_agent.discover_attractions("Paris")
+        assert len(set(attractions)) == len(attractions)
+    
+    def test_calculate_activities_cost(self, attraction_agent):
         """Test activities cost calculation"""
-        agent = AttractionAgent()
-        attractions = agent.discover_attractions("Paris")
-        cost = agent.calculate_activities_cost(attractions)
+        attractions = attraction_agent.discover_attractions("Paris")
+        cost = attraction_agent.calculate_activities_cost(attractions)
         assert cost > 0
 
 
 class TestItineraryAgent:
     """Tests for ItineraryAgent"""
     
-    def test_init(self):
+    def test_init(self, itinerary_agent):
         """Test ItineraryAgent initialization"""
-        agent = ItineraryAgent()
-        assert agent.initialized_at is not None
+        assert itinerary_agent.initialized_at is not None
     
-    def test_create_itinerary(self):
+    def test_create_itinerary(self, itinerary_agent):
         """Test itinerary creation"""
-        agent = ItineraryAgent()
-        itinerary = agent.create_itinerary("Paris", "2024-06-01", "2024-06-07")
+        itinerary = itinerary_agent.create_itinerary("Paris", "2024-06-01", "2024-06-07")
         assert itinerary.destination == "Paris"
         assert len(itinerary.days) == 7
     
-    def test_get_daily_summary(self):
+    def test_get_daily_summary(self, itinerary_agent):
         """Test daily summary retrieval"""
-        agent = ItineraryAgent()
-        itinerary = agent.create_itinerary("Paris", "2024-06-01", "2024-06-03")
-        summary = agent.get_daily_summary(itinerary, 1)
+        itinerary = itinerary_agent.create_itinerary("Paris", "2024-06-01", "2024-06-03")
+        summary = itinerary_agent.get_daily_summary(itinerary, 1)
         assert summary is not None
         assert "Day 1" in summary
+    
+    def test_add_activity_keeps_time_order(self, itinerary_agent):
+        """Test added activities are placed by time"""
+        itinerary = itinerary_agent.create_itinerary(
+            "Paris", "2024-06-01", "2024-06-01", attractions=["A", "B", "C", "D", "E"]
+        )
+        itinerary_agent.add_activity(itinerary, 1, {"time": "12:00", "description": "Lunch"})
+        itinerary_agent.add_activity(itinerary, 1, {"time": "19:00", "description": "Show"})
+        
+        times = [a["time"] for a in itinerary.days[0].activities]
+        assert times == sorted(times)
+        descriptions = [a["description"] for a in itinerary.days[0].activities]
+        assert descriptions[-4:] == ["Visit D", "Dinner at local restaurant", "Show", "Visit E"]
+    
+    def test_dinner_ends_generated_day(self, itinerary_agent):
+        """Test generated days keep attractions in order with dinner last"""
+        itinerary = itinerary_agent.create_itinerary(
+            "Paris", "2024-06-01", "2024-06-01", attractions=["A", "B", "C", "D", "E"]
+        )
+        descriptions = [a["description"] for a in itinerary.days[0].activities]
+        assert descriptions[-3:] == ["Visit D", "Visit E", "Dinner at local restaurant"]
+    
+    def test_add_activity_to_unsorted_day(self, itinerary_agent):
+        """Test adding to a caller-built unsorted day sorts it like before"""
+        day = DayPlan(1, "2024-06-01", [
+            {"time": "15:00", "description": "Museum"},
+            {"time": "09:00", "description": "Breakfast"},
+        ])
+        itinerary = Itinerary("Paris", "2024-06-01", "2024-06-01", [day])
+        itinerary_agent.add_activity(itinerary, 1, {"time": "12:00", "description": "Lunch"})
+        
+        assert [a["description"] for a in day.activities] == ["Breakfast", "Lunch", "Museum"]
 
 
 class TestTravelConcierge:
     """Tests for TravelConcierge"""
     
-    def test_init(self):
+    def test_init(self, concierge):
         """Test TravelConcierge initialization"""
-        concierge = TravelConcierge()
         assert concierge.initialized_at is not None
         assert concierge.flight_agent is not None
         assert concierge.hotel_agent is not None
     
-    def test_process_request(self):
-        """Test processing a travel request"""
-        concierge = TravelConcierge()
-        request = TravelRequest(
+    def test_process_request_returns_destination(self, processed_result):
+        """Test the itinerary is for the requested destination"""
+        assert processed_result.destination == "Paris"
+    
+    def test_process_request_duration(self, processed_result):
+        """Test the trip duration counts both travel dates"""
+        assert processed_result.duration_days == 7
+    
+    def test_process_request_flights_nonempty(self, processed_result):
+        """Test flights are included when an origin is given"""
+        assert len(processed_result.flights) > 0
+    
+    def test_process_request_accommodations_nonempty(self, processed_result):
+        """Test accommodations are included"""
+        assert len(processed_result.accommodations) > 0
+    
+    def test_process_request_total_cost(self, processed_result):
+        """Test the total estimated cost is computed"""
+        assert processed_result.total_estimated_cost > 0
+    
+    def test_process_request_async(self, concierge, paris_request, processed_result):
+        """Test the concurrent request path matches the sequential one"""
+        result = asyncio.run(concierge.process_request_async(paris_request))
+        assert result == processed_result
+    
+    def test_process_batch(self, concierge):
+        """Test batch processing plans identical requests once, returning copies"""
+        paris = TravelRequest(
             destination="Paris",
             start_date="2024-06-01",
             end_date="2024-06-07",
-            origin="NYC",
-            travelers=2
+            origin="NYC"
         )
-        result = concierge.process_request(request)
-        assert result.destination == "Paris"
-        assert result.duration_days == 7
-        assert len(result.flights) > 0
-        assert len(result.accommodations) > 0
-        assert result.total_estimated_cost > 0
-    
-    def test_calculate_duration(self):
-        """Test duration calculation"""
+        tokyo = TravelRequest(
+            destination="Tokyo",
+            start_date="2024-06-01",
+            end_date="2024-06-03"
+        )
+        results = concierge.process_batch([paris, tokyo, paris])
+        assert [r.destination for r in results] == ["Paris", "Tokyo", "Paris"]
+        assert results[0] == results[2]
+        
+        results[0].attractions.clear()
+        results[0].daily_schedule[0]["activities"].clear()
+        assert results[2].attractions
+        assert results[2].daily_schedule[0]["activities"]
+    
+    def test_search_executor_restarts_after_shutdown(self, concierge, paris_request, processed_result):
+        """Test requests after shutdown_search_executor get a fresh search pool"""
+        shutdown_search_executor()
+        assert concierge.process_request(paris_request) == processed_result
+        assert asyncio.run(concierge.process_request_async(paris_request)) == processed_result
+    
+    def test_agents_created_lazily(self):
+        """Test specialized agents are only created on first use"""
+        # Needs its own instance: the shared fixture has already built agents
         concierge = TravelConcierge()
+        assert "flight_agent" not in concierge.__dict__
+        agent = concierge.flight_agent
+        assert concierge.flight_agent is agent
+    
+    def test_agents_shared_between_concierges(self):
+        """Test concierges with the same config reuse pooled agents"""
+        first = TravelConcierge()
+        second = TravelConcierge()
+        assert first.flight_agent is second.flight_agent
+        assert first.hotel_agent is second.hotel_agent
+    
+    def test_agents_shared_between_equal_configs(self):
+        """Test separately built but equal configs share pooled agents"""
+        first = TravelConcierge(Config())
+        second = TravelConcierge(Config())
+        assert first.config is not second.config
+        assert first.flight_agent is second.flight_agent
+    
+    def test_agent_pool_bounded(self):
+        """Test many distinct configs do not grow the agent pool without limit"""
+        for timeout in range(100):
+            TravelConcierge(Config(timeout=timeout)).flight_agent
+        info = _shared_agent.cache_info()
+        assert info.currsize == info.maxsize
+    
+    def test_calculate_duration(self, concierge):
+        """Test duration calculation"""
         duration = concierge._calculate_duration("2024-06-01", "2024-06-07")
         assert duration == 7
     
-    def test_get_status(self):
+    def test_get_status(self, concierge):
         """Test status retrieval"""
-        concierge = TravelConcierge()
         status = concierge.get_status()
         assert status["status"] == "active"
         assert "agents" in status
 
 
+class TestBudgetOptimizerAgent:
+    """Tests for BudgetOptimizerAgent"""
+    
+    def test_find_best_value_options(self, budget_agent):
+        """Test value ranking, budget filtering and tiers"""
+        options = [
+            {"name": "Hostel", "price": 40, "rating": 3.5, "features": ["wifi"]},
+            {"name": "Hotel", "price": 120, "rating": 4.5, "features": ["wifi", "pool"]},
+            {"name": "Resort", "price": 400, "rating": 5.0, "features": ["spa"]},
+        ]
+        results = budget_agent.find_best_value_options(options, budget=200, category="hotels")
+        
+        assert [r.name for r in results] == ["Hostel", "Hotel"]
+        assert results[0].tier == BudgetTier.BUDGET
+        assert all(r.savings >= 0 for r in results)
+        
+        top = budget_agent.find_best_value_options(options, budget=200, category="hotels", top_k=1)
+        assert [r.name for r in top] == ["Hostel"]
+    
+    def test_find_best_value_options_empty(self, budget_agent):
+        """Test empty option list"""
+        assert budget_agent.find_best_value_options([], budget=100, category="hotels") == []
+    
+    def test_budget_breakdown_remaining_computed(self, budget_agent):
+        """Test remaining is derived from the allocations"""
+        breakdown = BudgetBreakdown(total_budget=100, accommodation=30, food=20)
+        assert breakdown.remaining == 50
+        assert budget_agent.optimize_budget(1000, 5).remaining == pytest.approx(0.0)
+    
+    def test_optimize_budget_custom_priorities(self, budget_agent):
+        """Test custom priorities override only the categories they name"""
+        breakdown = budget_agent.optimize_budget(1000, 5, {PriorityCategory.FOOD: 0.4})
+        
+        assert PriorityCategory.FOOD.value == "food"
+        assert breakdown.food == pytest.approx(400)
+        assert breakdown.accommodation == pytest.approx(350)
+        assert breakdown.remaining == pytest.approx(-200)
+
+
+class TestCurrencyConverterAgent:
+    """Tests for CurrencyConverterAgent"""
+    
+    def test_convert(self, currency_agent):
+        """Test basic conversion"""
+        conversion = currency_agent.convert(100, "usd", "INR")
+        assert conversion.converted_amount == pytest.approx(8312)
+        assert conversion.original_currency == "USD"
+    
+    def test_convert_many(self, currency_agent):
+        """Test batch conversion matches single conversions"""
+        converted = currency_agent.convert_many([10, 250.5, 0], "eur", "jpy")
+        expected = [currency_agent.convert(a, "EUR", "JPY").converted_amount for a in (10, 250.5, 0)]
+        assert converted.tolist() == pytest.approx(expected)
+    
+    def test_multi_currency_breakdown(self, currency_agent):
+        """Test breakdown matches individual conversions"""
+        breakdown = currency_agent.get_multi_currency_breakdown(
+            1000, "inr", ["USD", "eur", "INR", "XYZ"]
+        )
+        
+        assert list(breakdown.conversions) == ["USD", "EUR", "XYZ"]
+        for currency, amount in breakdown.conversions.items():
+            expected = currency_agent.convert(1000, "INR", currency)
+            assert amount == pytest.approx(expected.converted_amount)
+            assert breakdown.exchange_rates[currency] == pytest.approx(expected.exchange_rate)
+    
+    def test_exchange_rates_read_only(self, currency_agent):
+        """Test the shared rate table cannot be edited out from under the rate matrix"""
+        with pytest.raises(TypeError):
+            currency_agent.EXCHANGE_RATES["USD"] = 90
+        assert currency_agent.convert(1, "USD", "INR").converted_amount == pytest.approx(83.12)
+    
+    def test_subclass_exchange_rates(self):
+        """Test a subclass overriding the rate table converts with its own rates"""
+        class FixedRateAgent(CurrencyConverterAgent):
+            EXCHANGE_RATES = {**CurrencyConverterAgent.EXCHANGE_RATES, "USD": 90.0}
+        
+        agent = FixedRateAgent()
+        assert agent.convert(1, "USD", "INR").converted_amount == pytest.approx(90.0)
+        assert agent.convert(90, "INR", "USD").converted_amount == pytest.approx(1.0)
+        assert CurrencyConverterAgent().convert(1, "USD", "INR").converted_amount == pytest.approx(83.12)
+    
+    def test_subclass_destination_currencies(self, currency_agent):
+        """Test a subclass overriding destinations resolves with its own aliases"""
+        class IslandAgent(CurrencyConverterAgent):
+            DESTINATION_CURRENCIES = {**CurrencyConverterAgent.DESTINATION_CURRENCIES, "Bali": "IDR"}
+        
+        assert IslandAgent().get_destination_currency("bali, indonesia") == "IDR"
+        assert currency_agent.get_destination_currency("Bali") is None
+        with pytest.raises(TypeError):
+            currency_agent.DESTINATION_CURRENCIES["Bali"] = "IDR"
+
+
+class TestDisruptionAgent:
+    """Tests for DisruptionAgent"""
+    
+    def test_detect_disruptions(self, disruption_agent):
+        """Test risk scoring and replanning decision"""
+        report = disruption_agent.detect_disruptions(
+            {"destination": "Paris", "start_date": "2024-06-01"},
+            {"severe_weather": {"date": "2024-06-02"}}
+        )
+        
+        assert report.risk_score == 30.0
+        assert not report.requires_replanning
+        
+        report = disruption_agent.detect_disruptions(
+            {"destination": "Paris", "start_date": "2024-06-01"},
+            {"flight_cancelled": True, "flight_delayed_hours": 5}
+        )
+        assert report.risk_score == 90.0
+        assert report.requires_replanning
+    
+    def test_disruption_timestamp_field(self):
+        """Test detected_at is a regular field that can be passed in"""
+        detected = datetime(2024, 6, 1, 9, 30)
+        disruption = Disruption(
+            DisruptionType.OTHER, DisruptionSeverity.LOW, "2024-06-01", "Strike",
+            detected_at=detected
+        )
+        assert asdict(disruption)["detected_at"] == detected
+        assert isinstance(Disruption(DisruptionType.OTHER, DisruptionSeverity.LOW, "", "").detected_at, datetime)
+    
+    def test_recommendations_are_unique(self, disruption_agent):
+        """Test repeated disruption types do not repeat recommendations"""
+        report = disruption_agent.detect_disruptions(
+            {"destination": "Paris", "start_date": "2024-06-01"},
+            {"flight_cancelled": True}
+        )
+        recommendations = disruption_agent._generate_recommendations(report.disruptions * 2)
+        assert recommendations == report.recommendations
+        assert len(recommendations) == len(set(recommendations))
+    
+    def test_indoor_replacement_leaves_original(self, disruption_agent):
+        """Test weather replanning does not mutate the original schedule"""
+        schedule = [
+            {"day": 1, "date": "2024-06-01", "activities": ["Walking tour"]},
+            {"day": 2, "date": "2024-06-02", "activities": ["Park picnic"]},
+        ]
+        adjusted = disruption_agent._replace_with_indoor_activities(schedule, "2024-06-02")
+        
+        assert schedule[1]["activities"] == ["Park picnic"]
+        assert adjusted[0] is schedule[0]
+        assert "Visit local museum" in adjusted[1]["activities"]
+    
+    def test_no_disruptions(self, disruption_agent):
+        """Test report without live data"""
+        report = disruption_agent.detect_disruptions({"destination": "Paris"})
+        assert report.risk_score == 0.0
+        assert report.disruptions == []
+
+
+class TestWeatherAgent:
+    """Tests for WeatherAgent"""
+    
+    def test_get_weather_summary(self, weather_agent):
+        """Test summary statistics over a forecast"""
+        forecasts = weather_agent.get_forecast("Paris", "2024-06-01", "2024-06-10")
+        summary = weather_agent.get_weather_summary(forecasts)
+        
+        assert summary["total_days"] == 10
+        assert summary["average_high"] == round(
+            sum(f.temperature_high for f in forecasts) / len(forecasts), 1
+        )
+        assert summary["max_precipitation_chance"] == 65.0
+        assert summary["rainy_days"] == 3
+    
+    def test_get_forecast_batch(self, weather_agent):
+        """Test forecast batch materializes per-day forecasts"""
+        batch = weather_agent.get_forecast("Paris", "2024-06-01", "2024-06-03")
+        
+        assert len(batch) == 3
+        assert batch[1].date == "2024-06-02"
+        assert batch[1].temperature_high == 26.0
+        assert [f.condition for f in batch] == ["sunny", "partly cloudy", "sunny"]
+    
+    def test_get_forecast_batch_slice(self, weather_agent):
+        """Test slicing a forecast batch gives a list of forecasts"""
+        batch = weather_agent.get_forecast("Paris", "2024-06-01", "2024-06-05")
+        
+        first_three = batch[:3]
+        assert isinstance(first_three, list)
+        assert [f.date for f in first_three] == ["2024-06-01", "2024-06-02", "2024-06-03"]
+        assert batch[-2:] == list(batch)[-2:]
+    
+    def test_forecast_batch_equality(self, weather_agent):
+        """Test batches compare by value, including against a list of forecasts"""
+        batch = weather_agent.get_forecast("Paris", "2024-06-01", "2024-06-03")
+        
+        assert batch == weather_agent.get_forecast("Paris", "2024-06-01", "2024-06-03")
+        assert batch != weather_agent.get_forecast("Rome", "2024-06-01", "2024-06-03")
+        assert batch == list(batch)
+        assert _as_batch(list(batch)) == batch
+    
+    def test_get_weather_warnings_keeps_value_types(self, weather_agent):
+        """Test warnings show the caller's values without float conversion"""
+        forecasts = [
+            WeatherForecast("2024-06-01", "Paris", 36, 3, "sunny", 80, 60, 15, "Hot"),
+        ]
+        assert weather_agent.get_weather_warnings(forecasts) == [
+            "High chance of rain on 2024-06-01 (80%)",
+            "Extreme heat expected on 2024-06-01 (36°C)",
+            "Cold weather on 2024-06-01 (3°C)",
+        ]
+    
+    def test_as_batch_keeps_descriptions(self):
+        """Test converting a forecast list to a batch keeps each description"""
+        forecasts = [
+            WeatherForecast("2024-06-01", "Paris", 25.0, 18.0, "sunny", 20.0, 60.0, 15.0, "Clear skies"),
+            WeatherForecast("2024-06-02", "Paris", 22.0, 16.0, "rainy", 80.0, 85.0, 20.0, "Showers"),
+        ]
+        assert list(_as_batch(forecasts)) == forecasts
+    
+    def test_get_weather_warnings(self, weather_agent):
+        """Test warnings are reported day by day for flagged forecasts"""
+        forecasts = weather_agent.get_forecast("Paris", "2024-06-01", "2024-06-13")
+        warnings = weather_agent.get_weather_warnings(forecasts)
+        
+        assert warnings == [
+            "High chance of rain on 2024-06-12 (75.0%)",
+            "High chance of rain on 2024-06-13 (80.0%)",
+        ]
+    
+    def test_suggest_activity_adjustments_batch(self, weather_agent):
+        """Test batch suggestions match the per-day rules"""
+        forecasts = weather_agent.get_forecast("Paris", "2024-06-01", "2024-06-12")
+        
+        assert weather_agent.suggest_activity_adjustments_batch(forecasts) == [
+            weather_agent.suggest_activity_adjustments(f) for f in forecasts
+        ]
+    
+    def test_get_weather_summary_empty(self, weather_agent):
+        """Test summary of an empty forecast"""
+        assert weather_agent.get_weather_summary([]) == {}
+
+
+class TestRestaurantAgent:
+    """Tests for RestaurantAgent"""
+    
+    def test_discover_restaurants(self, restaurant_agent):
+        """Test restaurant discovery fills in the destination"""
+        restaurants = restaurant_agent.discover_restaurants("Lisbon")
+        
+        assert len(restaurants) == 8
+        assert restaurants[0].name == "La Bella Lisbon"
+        assert restaurants[0].location == "Downtown, Lisbon"
+    
+    def test_discover_restaurants_with_filters(self, restaurant_agent):
+        """Test cuisine, dietary and price filters combine"""
+        restaurants = restaurant_agent.discover_restaurants(
+            "Lisbon",
+            cuisines=["indian", "vegetarian", "french"],
+            dietary_restrictions=["vegan"],
+            price_range="$$"
+        )
+        
+        assert [r.cuisine for r in restaurants] == ["indian", "vegetarian"]
+    
+    def test_restaurant_is_slotted(self, restaurant_agent):
+        """Test restaurants carry no per-instance dict or extra asdict fields"""
+        restaurant = restaurant_agent.discover_restaurants("Lisbon")[0]
+        
+        assert not hasattr(restaurant, "__dict__")
+        assert "_dietary_set" not in asdict(restaurant)
+    
+    def test_dining_itinerary_days_are_independent(self, restaurant_agent):
+        """Test cached picks are materialized separately for each day"""
+        itinerary = restaurant_agent.create_dining_itinerary("Lisbon", 2)
+        
+        assert itinerary["Day 1"]["breakfast"][0].name == "Le Gourmet Lisbon"
+        assert itinerary["Day 1"]["dinner"] == itinerary["Day 2"]["dinner"]
+        assert itinerary["Day 1"]["dinner"][0] is not itinerary["Day 2"]["dinner"][0]
+    
+    def test_discover_restaurants_returns_fresh_objects(self, restaurant_agent):
+        """Test callers cannot modify the shared catalog"""
+        restaurant_agent.discover_restaurants("Lisbon")[0].rating = 1.0
+        
+        assert restaurant_agent.discover_restaurants("Lisbon")[0].rating == 4.6
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestConfig:
+    """Test cases for configuration loading"""
+    
+    @pytest.fixture(autouse=True)
+    def fresh_config(self):
+        get_config.cache_clear()
+        yield
+        get_config.cache_clear()
+    
+    def test_integer_settings_read_from_environment(self, monkeypatch):
+        """Test TIMEOUT and MAX_RETRIES are parsed from the environment"""
+        monkeypatch.setenv("TIMEOUT", "12")
+        monkeypatch.setenv("MAX_RETRIES", "5")
+        config = get_config()
+        
+        assert config.timeout == 12
+        assert config.max_retries == 5
+    
+    def test_integer_settings_default_when_unset(self, monkeypatch):
+        """Test unset or empty integer settings fall back to their defaults"""
+        monkeypatch.delenv("TIMEOUT", raising=False)
+        monkeypatch.setenv("MAX_RETRIES", "")
+        config = get_config()
+        
+        assert config.timeout == 30
+        assert config.max_retries == 3
+    
+    def test_malformed_integer_setting_rejected(self, monkeypatch):
+        """Test a non-integer setting raises a clear error when the config is built"""
+        monkeypatch.setenv("TIMEOUT", "thirty")
+        
+        with pytest.raises(ValueError, match="TIMEOUT environment variable must be an integer"):
+            get_config()
@@ -0,0 +1,243 @@
+"""Tests for the SmartTravel FastAPI backend"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api
+from api import PlanBatcher, PlanLimiter, TTLCache
+from smarttravel.agents.concierge import TravelConcierge, TravelItinerary, TravelRequest
+
+TRIP = {
+    "destination": "Paris",
+    "start_date": "2024-06-01",
+    "end_date": "2024-06-05",
+    "origin": "NYC",
+    "travelers": 2,
+}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Test client with a fresh, empty plan cache"""
+    monkeypatch.setattr(api, "plan_cache", TTLCache(api.PLAN_CACHE_SIZE, api.PLAN_CACHE_TTL_SECONDS))
+    with TestClient(api.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def planned(client, monkeypatch):
+    """Destinations of the trip requests that reached the batcher"""
+    calls = []
+    submit = api.plan_batcher.submit
+    
+    async def counting_submit(travel_request):
+        calls.append(travel_request.destination)
+        return await submit(travel_request)
+    
+    monkeypatch.setattr(api.plan_batcher, "submit", counting_submit)
+    return calls
+
+
+def _expire_all(cache):
+    """Make every cache entry look expired."""
+    for key, (_, value) in cache._entries.items():
+        cache._entries[key] = (time.monotonic() - 1, value)
+
+
+class RecordingConcierge(TravelConcierge):
+    """Concierge that records what it plans and fails for unknown destinations"""
+    
+    def __init__(self, delay: float = 0.01):
+        super().__init__()
+        self.delay = delay
+        self.planned = []
+    
+    async def process_request_async(self, request):
+        self.planned.append(request.destination)
+        await asyncio.sleep(self.delay)
+        if request.destination == "Nowhere":
+            raise ValueError("unknown destination")
+        return TravelItinerary(destination=request.destination, duration_days=3)
+
+
+def _request(destination):
+    return TravelRequest(destination=destination, start_date="2024-06-01", end_date="2024-06-03")
+
+
+def _run_with_batcher(scenario, concierge, max_batch_size=8, max_wait_ms=50):
+    """Run scenario(batcher) on a started batcher, stopping it afterwards"""
+    async def main():
+        batcher = PlanBatcher(concierge, max_batch_size, max_wait_ms)
+        batcher.start()
+        try:
+            return await scenario(batcher)
+        finally:
+            await batcher.stop()
+    
+    return asyncio.run(main())
+
+
+class TestPlanBatcher:
+    """Tests for PlanBatcher"""
+    
+    def test_results_in_order_and_deduplicated(self):
+        """Test each caller gets its own itinerary and identical requests are planned once"""
+        concierge = RecordingConcierge()
+        
+        async def scenario(batcher):
+            return await asyncio.gather(
+                *(batcher.submit(_request(d)) for d in ("Paris", "Tokyo", "Paris"))
+            )
+        
+        results = _run_with_batcher(scenario, concierge)
+        assert [r.destination for r in results] == ["Paris", "Tokyo", "Paris"]
+        assert sorted(concierge.planned) == ["Paris", "Tokyo"]
+        assert results[0] == results[2] and results[0] is not results[2]
+    
+    def test_failed_request_isolated(self):
+        """Test one failing request neither fails nor replans its neighbours"""
+        concierge = RecordingConcierge()
+        
+        async def scenario(batcher):
+            return await asyncio.gather(
+                *(batcher.submit(_request(d)) for d in ("Paris", "Nowhere", "Tokyo")),
+                return_exceptions=True
+            )
+        
+        paris, nowhere, tokyo = _run_with_batcher(scenario, concierge)
+        assert paris.destination == "Paris"
+        assert isinstance(nowhere, ValueError)
+        assert tokyo.destination == "Tokyo"
+        assert len(concierge.planned) == 3
+    
+    def test_lone_request_not_delayed(self):
+        """Test a request arriving to an empty queue skips the batching window"""
+        concierge = RecordingConcierge(delay=0)
+        
+        async def scenario(batcher):
+            started = time.monotonic()
+            await batcher.submit(_request("Paris"))
+            return time.monotonic() - started
+        
+        assert _run_with_batcher(scenario, concierge, max_wait_ms=5000) < 1.0
+    
+    def test_stop_finishes_in_flight_batches(self):
+        """Test stopping lets dispatched requests finish and rejects new ones"""
+        concierge = RecordingConcierge(delay=0.05)
+        
+        async def scenario(batcher):
+            pending = asyncio.ensure_future(batcher.submit(_request("Paris")))
+            while not concierge.planned:
+                await asyncio.sleep(0.001)
+            await batcher.stop()
+            
+            assert (await pending).destination == "Paris"
+            with pytest.raises(RuntimeError):
+                await batcher.submit(_request("Tokyo"))
+        
+        _run_with_batcher(scenario, concierge)
+
+
+class TestTTLCache:
+    """Tests for TTLCache"""
+    
+    def test_expired_entry_dropped(self):
+        """Test entries past their TTL are treated as missing and removed"""
+        cache = TTLCache(maxsize=4, ttl_seconds=60)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        
+        _expire_all(cache)
+        assert cache.get("a") is None
+        assert "a" not in cache._entries
+    
+    def test_least_recently_used_evicted(self):
+        """Test the least recently used entry is evicted once full"""
+        cache = TTLCache(maxsize=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+
+class TestPlanTripEndpoint:
+    """Tests for /plan_trip caching and admission control"""
+    
+    def test_repeat_request_served_from_cache(self, client, planned):
+        """Test an identical request is answered without replanning"""
+        first = client.post("/plan_trip", json=TRIP)
+        second = client.post("/plan_trip", json=TRIP)
+        
+        assert first.status_code == second.status_code == 200
+        assert first.json() == second.json()
+        assert planned == ["Paris"]
+    
+    def test_expired_plan_replanned(self, client, planned):
+        """Test a request is planned again once its cached response expires"""
+        client.post("/plan_trip", json=TRIP)
+        _expire_all(api.plan_cache)
+        client.post("/plan_trip", json=TRIP)
+        
+        assert planned == ["Paris", "Paris"]
+    
+    def test_evicted_plan_replanned(self, client, planned, monkeypatch):
+        """Test the least recently used plan is evicted once the cache is full"""
+        monkeypatch.setattr(api, "plan_cache", TTLCache(1, api.PLAN_CACHE_TTL_SECONDS))
+        client.post("/plan_trip", json=TRIP)
+        client.post("/plan_trip", json={**TRIP, "destination": "Tokyo"})
+        client.post("/plan_trip", json=TRIP)
+        
+        assert planned == ["Paris", "Tokyo", "Paris"]
+    
+    def test_saturated_limiter_rejects_with_429(self, client, planned, monkeypatch):
+        """Test requests are shed with 429 when every slot and queue place is taken"""
+        monkeypatch.setattr(api, "plan_limiter", PlanLimiter(max_concurrent=0, max_queued=0))
+        response = client.post("/plan_trip", json=TRIP)
+        
+        assert response.status_code == 429
+        assert planned == []
+
+
+class TestResponseEncoding:
+    """Tests for compressed JSON responses"""
+    
+    def test_large_response_gzipped(self, client):
+        """Test large responses are gzip-encoded when the client accepts it"""
+        response = client.post("/plan_trip", json=TRIP, headers={"Accept-Encoding": "gzip"})
+        
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["content-type"] == "application/json"
+        plain = client.post("/plan_trip", json=TRIP, headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in plain.headers
+        assert response.json() == plain.json()
+    
+    def test_small_response_not_gzipped(self, client):
+        """Test responses under the size threshold are sent uncompressed"""
+        response = client.get("/health", headers={"Accept-Encoding": "gzip"})
+        
+        assert "content-encoding" not in response.headers
+        assert response.json()["status"] == "healthy"
+
+
+class TestHealthEndpoint:
+    """Tests for /health"""
+    
+    def test_timestamp_is_utc(self, client):
+        """Test the health timestamp is a current UTC time with a Z suffix"""
+        before = datetime.now(timezone.utc)
+        timestamp = client.get("/health").json()["timestamp"]
+        after = datetime.now(timezone.utc)
+        
+        assert timestamp.endswith("Z")
+        parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        assert parsed.utcoffset() == timedelta(0)
+        assert before <= parsed <= after
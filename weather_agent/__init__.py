@@ -3,7 +3,21 @@
 A weather information agent that provides real-time weather data.
 """
 
-from .agent import WeatherAgent
+import importlib
 
-__all__ = ['WeatherAgent']
+__all__ = ['WeatherAgent', 'WeatherResult']
 __version__ = '1.0.0'
+
+
+def __getattr__(name):
+    # Agent classes are loaded on first access (PEP 562), so reading
+    # __version__ does not import the agent module
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module('.agent', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,13 +1,180 @@
 """Weather Agent - Provides weather information using AI"""
 
+import logging
 import os
-import google.generativeai as genai
-from typing import Optional, Dict
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+_WEATHER_PROMPT = """Provide {query_type} weather information for {location}.
+        Include temperature, conditions, humidity, and any relevant alerts.
+        Format the response as a brief, informative summary."""
+
+_PATTERN_PROMPT = """Analyze the typical weather patterns for {location} over the next {days} days.
+        Include insights about temperature trends, precipitation likelihood, and seasonal considerations."""
+
+
+@dataclass(slots=True, frozen=True)
+class WeatherResult:
+    """Result of a weather information query.
+    
+    Use dataclasses.asdict() where a plain dict is needed, e.g. for JSON.
+    """
+    status: str
+    location: str
+    query_type: Optional[str] = None
+    weather_info: Optional[str] = None
+    error: Optional[str] = None
+
+
+@lru_cache(maxsize=8)
+def _model_handle(api_key: str, model_id: str) -> Any:
+    """Return a model handle shared by all agents using the same key and model."""
+    import google.generativeai as genai
+    
+    return genai.GenerativeModel(model_id)
+
+
+def _get_model(api_key: str, model_id: str = 'gemini-pro') -> Any:
+    """Configure the SDK for a key and return the shared model handle.
+    
+    genai.configure() sets process-wide SDK state, so it runs on every call
+    rather than only when the handle is first built; the key of the most
+    recently created agent is the one the SDK uses.
+    """
+    # Imported here rather than at module level: the SDK pulls in gRPC and
+    # protobuf, which callers that never build an agent shouldn't pay for
+    import google.generativeai as genai
+    
+    genai.configure(api_key=api_key)
+    return _model_handle(api_key, model_id)
+
+
+# Requests currently being sent, so concurrent identical calls share one
+_inflight: Dict[Tuple[Any, str], Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _call(model: Any, prompt: str) -> str:
+    """Send a prompt to the model, coalescing identical concurrent requests.
+    
+    The first caller for a (model, prompt) pair makes the API call; callers
+    arriving while it is in flight wait for and share its result or error.
+    """
+    key = (model, prompt)
+    with _inflight_lock:
+        pending = _inflight.get(key)
+        leader = pending is None
+        if pending is None:
+            future: Future = Future()
+            _inflight[key] = future
+        else:
+            future = pending
+    
+    if leader:
+        try:
+            future.set_result(model.generate_content(prompt).text)
+        except BaseException as e:
+            # BaseException too, so followers are released on e.g. KeyboardInterrupt
+            future.set_exception(e)
+        finally:
+            with _inflight_lock:
+                del _inflight[key]
+    
+    return future.result()
+
+
+# Responses include "current" conditions, so they are only reused briefly
+_RESPONSE_TTL_SECONDS = 10 * 60
+_RESPONSE_CACHE_SIZE = 256
+_response_cache: OrderedDict[Tuple[Any, str], Tuple[float, str]] = OrderedDict()
+_response_lock = threading.Lock()
+
+
+def _remember(cache: OrderedDict, key: Tuple[Any, str], text: str, max_size: int) -> None:
+    """Store a timestamped response, evicting the least recently used entries."""
+    cache[key] = (time.monotonic(), text)
+    cache.move_to_end(key)
+    while len(cache) > max_size:
+        cache.popitem(last=False)
+
+
+def _generate(model: Any, prompt: str) -> str:
+    """Generate a response for a prompt, cached per model and prompt.
+    
+    Responses are reused for _RESPONSE_TTL_SECONDS. Failed calls raise and
+    are not cached, so they are retried next time.
+    """
+    key = (model, prompt)
+    with _response_lock:
+        entry = _response_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < _RESPONSE_TTL_SECONDS:
+            _response_cache.move_to_end(key)
+            return entry[1]
+    
+    text = _call(model, prompt)
+    with _response_lock:
+        _remember(_response_cache, key, text, _RESPONSE_CACHE_SIZE)
+    return text
+
+
+# Pattern analyses change slowly, so they are served stale-while-revalidate:
+# fresh entries are returned as is, stale ones are returned while a background
+# thread refreshes them, and only expired or missing entries block on the API.
+_PATTERN_FRESH_SECONDS = 60 * 60
+_PATTERN_MAX_AGE_SECONDS = 24 * 60 * 60
+_PATTERN_CACHE_SIZE = 256
+_pattern_cache: OrderedDict[Tuple[Any, str], Tuple[float, str]] = OrderedDict()
+_pattern_refreshing: Set[Tuple[Any, str]] = set()
+_pattern_lock = threading.Lock()
+
+
+def _fetch_pattern(model: Any, prompt: str) -> str:
+    """Call the model and record the result in the pattern cache.
+    
+    Entries past _PATTERN_MAX_AGE_SECONDS are dropped on each store.
+    """
+    text = _call(model, prompt)
+    with _pattern_lock:
+        _remember(_pattern_cache, (model, prompt), text, _PATTERN_CACHE_SIZE)
+        cutoff = time.monotonic() - _PATTERN_MAX_AGE_SECONDS
+        for key in [k for k, (fetched_at, _) in _pattern_cache.items() if fetched_at <= cutoff]:
+            del _pattern_cache[key]
+    return text
+
+
+def _refresh_pattern(model: Any, prompt: str) -> None:
+    """Background refresh; on failure the previous entry is kept."""
+    try:
+        _fetch_pattern(model, prompt)
+    except Exception:
+        logger.warning("Background refresh of weather pattern analysis failed", exc_info=True)
+    finally:
+        with _pattern_lock:
+            _pattern_refreshing.discard((model, prompt))
+
+
+def _start_pattern_refresh(model: Any, prompt: str) -> None:
+    """Start a background refresh unless one is already running."""
+    key = (model, prompt)
+    with _pattern_lock:
+        if key in _pattern_refreshing:
+            return
+        _pattern_refreshing.add(key)
+    threading.Thread(target=_refresh_pattern, args=key, daemon=True).start()
 
 
 class WeatherAgent:
     """An AI-powered agent that provides weather information and insights."""
     
+    __slots__ = ('api_key', 'model')
+    
     def __init__(self, api_key: Optional[str] = None):
         """Initialize the Weather Agent.
         
@@ -18,10 +185,9 @@ class WeatherAgent:
         if not self.api_key:
             raise ValueError("API key must be provided or set in GOOGLE_API_KEY environment variable")
         
-        genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel('gemini-pro')
+        self.model = _get_model(self.api_key)
     
-    def get_weather_info(self, location: str, query_type: str = "current") -> Dict:
+    def get_weather_info(self, location: str, query_type: str = "current") -> WeatherResult:
         """Get weather information for a location.
         
         Args:
@@ -29,26 +195,24 @@ class WeatherAgent:
             query_type: Type of query (current, forecast, historical)
             
         Returns:
-            Dictionary containing weather information
+            WeatherResult with the weather summary, or the error on failure
         """
-        prompt = f"""Provide {query_type} weather information for {location}.
-        Include temperature, conditions, humidity, and any relevant alerts.
-        Format the response as a brief, informative summary."""
+        prompt = _WEATHER_PROMPT.format(query_type=query_type, location=location)
         
         try:
-            response = self.model.generate_content(prompt)
-            return {
-                'status': 'success',
-                'location': location,
-                'query_type': query_type,
-                'weather_info': response.text
-            }
+            return WeatherResult(
+                status='success',
+                location=location,
+                query_type=query_type,
+                weather_info=_generate(self.model, prompt)
+            )
         except Exception as e:
-            return {
-                'status': 'error',
-                'location': location,
-                'error': str(e)
-            }
+            return WeatherResult(
+                status='error',
+                location=location,
+                query_type=query_type,
+                error=str(e)
+            )
     
     def analyze_weather_patterns(self, location: str, days: int = 7) -> str:
         """Analyze weather patterns for a location.
@@ -60,13 +224,29 @@ class WeatherAgent:
         Returns:
             Weather pattern analysis
         """
-        prompt = f"""Analyze the typical weather patterns for {location} over the next {days} days.
-        Include insights about temperature trends, precipitation likelihood, and seasonal considerations."""
+        prompt = _PATTERN_PROMPT.format(location=location, days=days)
+        
+        key = (self.model, prompt)
+        with _pattern_lock:
+            entry = _pattern_cache.get(key)
+            if entry is not None:
+                _pattern_cache.move_to_end(key)
+        
+        if entry is not None:
+            fetched_at, text = entry
+            age = time.monotonic() - fetched_at
+            if age < _PATTERN_FRESH_SECONDS:
+                return text
+            if age < _PATTERN_MAX_AGE_SECONDS:
+                _start_pattern_refresh(self.model, prompt)
+                return text
         
         try:
-            response = self.model.generate_content(prompt)
-            return response.text
+            return _fetch_pattern(self.model, prompt)
         except Exception as e:
+            if entry is not None:
+                # Expired, but still better than an error during an outage
+                return entry[1]
             return f"Error analyzing weather patterns: {str(e)}"
 
 
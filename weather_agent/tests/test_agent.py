@@ -0,0 +1,225 @@
+"""Tests for the Gemini-backed weather agent"""
+
+import logging
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+from weather_agent import agent as agent_module
+from weather_agent import WeatherAgent
+
+
+class FakeModel:
+    """Stand-in for genai.GenerativeModel that records the prompts it gets."""
+    
+    def __init__(self, model_id):
+        self.model_id = model_id
+        self.prompts = []
+        self.error = None
+        self.gate = None
+    
+    def generate_content(self, prompt):
+        self.prompts.append(prompt)
+        if self.gate is not None:
+            self.gate.wait(timeout=2)
+        if self.error is not None:
+            raise self.error
+        return types.SimpleNamespace(text=f"response {len(self.prompts)}")
+
+
+def _reset_caches():
+    agent_module._model_handle.cache_clear()
+    agent_module._response_cache.clear()
+    agent_module._pattern_cache.clear()
+
+
+def _age_entries(cache, seconds):
+    """Make every cached entry look the given number of seconds older."""
+    for key, (fetched_at, text) in cache.items():
+        cache[key] = (fetched_at - seconds, text)
+
+
+def _run_concurrently(targets, gate, model, timeout=2.0):
+    """Start threads, release the gated model once a call is in flight, join them."""
+    threads = [threading.Thread(target=target, daemon=True) for target in targets]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + timeout
+    while not model.prompts and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.1)  # let the remaining threads join the in-flight call
+    gate.set()
+    for thread in threads:
+        thread.join(timeout)
+    return threads
+
+
+def _wait_for_refreshes(timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while agent_module._pattern_refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def fake_genai(monkeypatch):
+    """Install a fake google.generativeai module and reset the module caches."""
+    genai = types.ModuleType("google.generativeai")
+    genai.configured_keys = []
+    genai.configure = lambda api_key: genai.configured_keys.append(api_key)
+    genai.GenerativeModel = FakeModel
+    google = types.ModuleType("google")
+    google.generativeai = genai
+    monkeypatch.setitem(sys.modules, "google", google)
+    monkeypatch.setitem(sys.modules, "google.generativeai", genai)
+    
+    _reset_caches()
+    yield genai
+    _reset_caches()
+
+
+@pytest.fixture
+def weather_agent(fake_genai):
+    return WeatherAgent("test-key")
+
+
+class TestModelHandle:
+    """Tests for the shared Gemini model handle"""
+    
+    def test_same_key_shares_model(self, fake_genai):
+        """Test agents with the same key reuse one model handle"""
+        assert WeatherAgent("key-a").model is WeatherAgent("key-a").model
+    
+    def test_configure_runs_for_every_agent(self, fake_genai):
+        """Test the SDK is reconfigured when an agent reuses a cached handle"""
+        WeatherAgent("key-a")
+        WeatherAgent("key-b")
+        WeatherAgent("key-a")
+        assert fake_genai.configured_keys == ["key-a", "key-b", "key-a"]
+
+
+class TestResponseCache:
+    """Tests for the TTL cache in front of generate_content"""
+    
+    def test_current_weather_reused_within_ttl(self, weather_agent):
+        """Test a repeated query inside the TTL does not call the model again"""
+        first = weather_agent.get_weather_info("London", "current")
+        second = weather_agent.get_weather_info("London", "current")
+        assert first.weather_info == second.weather_info
+        assert len(weather_agent.model.prompts) == 1
+    
+    def test_current_weather_refetched_after_ttl(self, weather_agent):
+        """Test an entry older than the TTL is fetched again"""
+        first = weather_agent.get_weather_info("London", "current")
+        _age_entries(agent_module._response_cache, agent_module._RESPONSE_TTL_SECONDS)
+        second = weather_agent.get_weather_info("London", "current")
+        assert len(weather_agent.model.prompts) == 2
+        assert second.weather_info != first.weather_info
+
+
+class TestRequestCoalescing:
+    """Tests for sharing one in-flight call between identical requests"""
+    
+    def test_concurrent_identical_requests_share_one_call(self, weather_agent):
+        """Test concurrent identical queries make a single model call"""
+        weather_agent.model.gate = gate = threading.Event()
+        results = []
+        targets = [lambda: results.append(weather_agent.get_weather_info("London"))] * 8
+        
+        _run_concurrently(targets, gate, weather_agent.model)
+        assert len(results) == 8
+        assert {result.weather_info for result in results} == {"response 1"}
+        assert len(weather_agent.model.prompts) == 1
+        assert agent_module._inflight == {}
+    
+    def test_followers_released_on_base_exception(self, weather_agent):
+        """Test waiting callers are not left blocked when the leader is interrupted"""
+        class Interrupted(BaseException):
+            pass
+        
+        weather_agent.model.gate = gate = threading.Event()
+        weather_agent.model.error = Interrupted()
+        prompt = "Provide current weather information for London."
+        raised = []
+        
+        def call():
+            try:
+                agent_module._call(weather_agent.model, prompt)
+            except Interrupted:
+                raised.append(True)
+        
+        threads = _run_concurrently([call] * 4, gate, weather_agent.model)
+        assert not any(thread.is_alive() for thread in threads)
+        assert raised == [True] * 4
+        assert len(weather_agent.model.prompts) == 1
+        assert agent_module._inflight == {}
+
+
+class TestPatternCache:
+    """Tests for stale-while-revalidate pattern analyses"""
+    
+    def test_fresh_entry_served_from_cache(self, weather_agent):
+        """Test a fresh analysis is returned without calling the model"""
+        first = weather_agent.analyze_weather_patterns("Paris")
+        assert weather_agent.analyze_weather_patterns("Paris") == first
+        assert len(weather_agent.model.prompts) == 1
+    
+    def test_stale_entry_served_while_refreshing(self, weather_agent):
+        """Test a stale analysis is returned and refreshed in the background"""
+        first = weather_agent.analyze_weather_patterns("Paris")
+        _age_entries(agent_module._pattern_cache, agent_module._PATTERN_FRESH_SECONDS)
+        
+        assert weather_agent.analyze_weather_patterns("Paris") == first
+        _wait_for_refreshes()
+        assert len(weather_agent.model.prompts) == 2
+        assert weather_agent.analyze_weather_patterns("Paris") != first
+    
+    def test_expired_entry_fetched_again(self, weather_agent):
+        """Test an expired analysis blocks on a new model call"""
+        first = weather_agent.analyze_weather_patterns("Paris")
+        _age_entries(agent_module._pattern_cache, agent_module._PATTERN_MAX_AGE_SECONDS)
+        
+        assert weather_agent.analyze_weather_patterns("Paris") != first
+        assert len(weather_agent.model.prompts) == 2
+    
+    def test_expired_entry_served_during_outage(self, weather_agent):
+        """Test an expired analysis is returned when the model call fails"""
+        first = weather_agent.analyze_weather_patterns("Paris")
+        _age_entries(agent_module._pattern_cache, agent_module._PATTERN_MAX_AGE_SECONDS)
+        weather_agent.model.error = RuntimeError("service unavailable")
+        
+        assert weather_agent.analyze_weather_patterns("Paris") == first
+    
+    def test_failed_refresh_logged(self, weather_agent, caplog):
+        """Test a failed background refresh keeps the entry and logs a warning"""
+        first = weather_agent.analyze_weather_patterns("Paris")
+        _age_entries(agent_module._pattern_cache, agent_module._PATTERN_FRESH_SECONDS)
+        weather_agent.model.error = RuntimeError("service unavailable")
+        
+        with caplog.at_level(logging.WARNING, logger=agent_module.__name__):
+            assert weather_agent.analyze_weather_patterns("Paris") == first
+            _wait_for_refreshes()
+        assert "refresh of weather pattern analysis failed" in caplog.text
+        assert weather_agent.analyze_weather_patterns("Paris") == first
+    
+    def test_cache_size_capped(self, weather_agent, monkeypatch):
+        """Test the least recently used analysis is evicted past the cap"""
+        monkeypatch.setattr(agent_module, "_PATTERN_CACHE_SIZE", 2)
+        for location in ("Paris", "Rome", "Oslo"):
+            weather_agent.analyze_weather_patterns(location)
+        
+        prompts = [prompt for _, prompt in agent_module._pattern_cache]
+        assert len(prompts) == 2
+        assert not any("Paris" in prompt for prompt in prompts)
+    
+    def test_entries_past_max_age_evicted(self, weather_agent):
+        """Test storing an analysis drops entries past the maximum age"""
+        weather_agent.analyze_weather_patterns("Paris")
+        _age_entries(agent_module._pattern_cache, agent_module._PATTERN_MAX_AGE_SECONDS)
+        weather_agent.analyze_weather_patterns("Rome")
+        
+        prompts = [prompt for _, prompt in agent_module._pattern_cache]
+        assert len(prompts) == 1
+        assert "Rome" in prompts[0]